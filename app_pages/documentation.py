@@ -1607,8 +1607,8 @@ def _render_implementation_details() -> None:
         - Incomplete tables → raise ValidationError with details
         
         **URL Sharing:**
-        - `encode_config()`: SimConfig → JSON → gzip → base64url
-        - `decode_config()`: base64url → gzip → JSON → SimConfig
+        - `encode_config()`: SimConfig → JSON → xz → base64url (memoized per JSON)
+        - `decode_config()`: base64url → xz (or legacy gzip) → JSON → SimConfig
         - Compression reduces 50KB config to ~2-3KB URL
         
         ---
@@ -250,15 +250,15 @@ def _render_dupe_accumulation_chart(pulls: list, upgrades: list) -> None:
         )
     )
 
+    # (day, card_id) -> first pull (1-based) that carried that card's upgrade,
+    # built in one pass instead of rescanning every pull per upgrade.
+    upgrade_pull_index: dict[tuple[int, str], int] = {}
+    for i, p in enumerate(pulls, start=1):
+        for pu in p.upgrades:
+            upgrade_pull_index.setdefault((p.day, pu.card_id), i)
+
     for u in upgrades:
-        pull_idx = next(
-            (
-                i + 1
-                for i, p in enumerate(pulls)
-                if p.day == u.day and any(pu.card_id == u.card_id for pu in p.upgrades)
-            ),
-            None,
-        )
+        pull_idx = upgrade_pull_index.get((u.day, u.card_id))
         if pull_idx is not None:
             fig.add_vline(
                 x=pull_idx,
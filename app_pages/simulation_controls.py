@@ -4,6 +4,7 @@ set goals, compare variants, and share configurations.
 """
 
 import hashlib
+import os
 from typing import Any
 
 import streamlit as st
@@ -203,7 +204,38 @@ def _run_cached_simulation(config_hash: str, _config: Any, variant_id: str = "va
 def _run_cached_mc(config_hash: str, _config: Any, num_runs: int, variant_id: str = "variant_b"):
     _ = config_hash
     run_fn = variants.get(variant_id).run_simulation
-    return run_monte_carlo(_config, num_runs=num_runs, run_fn=run_fn)
+    max_workers = _mc_worker_count(num_runs, _config.num_days)
+    return run_monte_carlo(_config, num_runs=num_runs, run_fn=run_fn, max_workers=max_workers)
+
+
+# Below this many simulated run-days, spawning workers (each re-imports
+# streamlit + simulation, ~80 MB RSS) costs more than it saves.
+_MC_POOL_MIN_RUN_DAYS = 20_000
+_MC_POOL_MAX_WORKERS = 4
+
+
+def _mc_worker_count(num_runs: int, num_days: int) -> int:
+    """Worker processes for a Monte Carlo batch; 1 means run in-process.
+
+    Serial by default. `MC_MAX_WORKERS` sets the pool size explicitly;
+    otherwise the pool is used only when this process may run on more than
+    one CPU (Streamlit Cloud gives a single shared core, while
+    `os.cpu_count()` reports the host's). Either way small batches stay
+    serial.
+    """
+    if num_runs * num_days < _MC_POOL_MIN_RUN_DAYS:
+        return 1
+    requested = os.environ.get("MC_MAX_WORKERS", "").strip()
+    if requested:
+        try:
+            return max(1, int(requested))
+        except ValueError:
+            return 1
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        available = 1
+    return min(_MC_POOL_MAX_WORKERS, available) if available > 1 else 1
 
 
 def _evaluate_goal(
@@ -4,8 +4,9 @@ Displays hero progression, card levels, skill tree progress,
 premium economics, and standard bluestar/coin charts.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
@@ -21,18 +22,169 @@ _PINK = "#DB2777"
 _HERO_COLORS = [_BLUE, _GREEN, _ORANGE, _RED, _VIOLET, _AMBER, _TEAL, _PINK,
                 "#0284C7", "#059669", "#D97706", "#E11D48", "#6D28D9", "#C2410C", "#0E7490", "#BE185D"]
 
+# Daily line traces longer than this are decimated before being sent to the
+# browser — a chart is only ~1-2k pixels wide anyway.
+_MAX_TRACE_POINTS = 2000
 
-def _styled_fig(title: str = "") -> go.Figure:
-    """Create a pre-styled Plotly figure for the light theme."""
-    fig = go.Figure()
-    fig.update_layout(
-        title=dict(text=title, font=dict(size=16)),
-        template="plotly_white",
-        hovermode="x unified",
-        margin=dict(l=40, r=20, t=50, b=40),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+# Traces longer than this render through WebGL. Decimated traces stay well
+# below it and keep SVG: browsers only allow ~8-16 live WebGL contexts, and
+# the dashboard draws more charts than that.
+_WEBGL_MIN_POINTS = 5000
+
+
+def _scatter(**kwargs: Any) -> go.Scatter:
+    """Line/area trace — go.Scatter, or go.Scattergl for very long traces."""
+    x = kwargs.get("x")
+    if x is not None and len(x) > _WEBGL_MIN_POINTS:
+        return go.Scattergl(**kwargs)
+    return go.Scatter(**kwargs)
+
+
+def _styled_fig(title: str = "", data: Optional[list] = None, **layout: Any) -> go.Figure:
+    """Create a pre-styled Plotly figure for the light theme.
+
+    Pass the full trace list as ``data`` and any extra layout keys (barmode,
+    axes, ...) as keywords so the figure is built and validated in one go
+    instead of via repeated add_trace/update_layout calls.
+    """
+    return go.Figure(
+        data=data,
+        layout=go.Layout(
+            title=dict(text=title, font=dict(size=16)),
+            template="plotly_white",
+            hovermode="x unified",
+            margin=dict(l=40, r=20, t=50, b=40),
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            **layout,
+        ),
     )
-    return fig
+
+
+def _ci_band(
+    means: Any, stds: Any, floor: Optional[float] = None,
+    max_points: int = _MAX_TRACE_POINTS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (x, y) polygon of a 95% CI ribbon for ``fill="toself"``.
+
+    Days are 1-indexed. ``floor`` clips the lower edge (levels and counts
+    can't go negative). Long series are bucketed on the same grid as
+    `_downsample`: each bucket spans its first to last day at the bucket's
+    highest upper / lowest lower bound, so the ribbon still encloses every
+    day while each edge stays within ``max_points``.
+    """
+    m = np.asarray(means, dtype=float)
+    s = np.asarray(stds, dtype=float)
+    if s.size != m.size:
+        s = np.zeros_like(m)
+    upper = m + 1.96 * s
+    lower = m - 1.96 * s
+    if floor is not None:
+        lower = np.maximum(lower, floor)
+    n = m.size
+    x = np.arange(1, n + 1)
+    if n > max_points:
+        width = _bucket_width(n, max_points)
+        starts = x[::width]
+        ends = np.minimum(starts + width - 1, n)
+        x = np.column_stack([starts, ends]).ravel()
+        upper = np.repeat(_bucketed(upper, width).max(axis=1), 2)
+        lower = np.repeat(_bucketed(lower, width).min(axis=1), 2)
+    return np.concatenate([x, x[::-1]]), np.concatenate([upper, lower[::-1]])
+
+
+def _bucket_width(n: int, max_points: int) -> int:
+    """Days per bucket when decimating an ``n``-day series to ~``max_points``."""
+    return -(-n // max(1, max_points // 2))
+
+
+def _bucketed(values: np.ndarray, width: int) -> np.ndarray:
+    """``values`` as (bucket, width) rows; the last bucket is edge-padded."""
+    rows = -(-values.size // width)
+    return np.pad(values, (0, rows * width - values.size), mode="edge").reshape(rows, width)
+
+
+def _downsample(
+    x: Any, y: Any, max_points: int = _MAX_TRACE_POINTS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max-per-bucket decimation for long daily line traces.
+
+    Keeps the lowest and highest point of each bucket (plus both endpoints),
+    so spikes and the overall envelope survive while the payload stays
+    bounded for multi-year simulations. Short series pass through unchanged.
+    """
+    xs = np.asarray(x)
+    ys = np.asarray(y, dtype=float)
+    n = ys.size
+    if n <= max_points:
+        return xs, ys
+
+    width = _bucket_width(n, max_points)
+    padded = _bucketed(ys, width)
+    offsets = np.arange(padded.shape[0]) * width
+    keep = np.concatenate([
+        offsets + padded.argmin(axis=1),
+        offsets + padded.argmax(axis=1),
+        [0, n - 1],
+    ])
+    keep = np.unique(np.minimum(keep, n - 1))
+    return xs[keep], ys[keep]
+
+
+def _snapshot_series(result: Any) -> Dict[str, Any]:
+    """Per-day series the deterministic charts need, memoized on the result.
+
+    Stored on the result object itself (like the engine's config lookup
+    caches), so widget reruns reuse it and it can never be served for a
+    different run.
+    """
+    series = getattr(result, "_snapshot_series_cache", None)
+    if series is None:
+        series = _build_snapshot_series(result.daily_snapshots)
+        object.__setattr__(result, "_snapshot_series_cache", series)
+    return series
+
+
+def _build_snapshot_series(snapshots: list) -> Dict[str, Any]:
+    """Extract the per-day series in one pass over the snapshots.
+
+    Scalar series are arrays; per-hero series are ``{hero_id: array}``.
+    """
+    scalar_fields = (
+        "day", "total_bluestars", "coins_earned_today", "coins_spent_today",
+        "coins_balance", "chapters_beaten_today", "chapters_beaten_total",
+    )
+    columns: Dict[str, list] = {name: [] for name in scalar_fields}
+    eoc_packs = []
+    hero_xp_ids: set[str] = set()
+    for s in snapshots:
+        for name in scalar_fields:
+            columns[name].append(getattr(s, name, 0))
+        eoc_packs.append(s.pack_counts_by_type.get("EndOfChapterPack", 0))
+        hero_xp_ids.update(s.hero_xp_today.keys())
+
+    last = snapshots[-1] if snapshots else None
+    level_ids = list(last.hero_levels.keys()) if last else []
+    card_ids = list(last.hero_card_avg_levels.keys()) if last else []
+    series: Dict[str, Any] = {
+        name: np.asarray(values) for name, values in columns.items()
+    }
+    series["eoc_packs"] = np.asarray(eoc_packs, dtype=int)
+    series["hero_levels"] = {
+        hid: np.fromiter((s.hero_levels.get(hid, 1) for s in snapshots), dtype=int)
+        for hid in level_ids
+    }
+    series["hero_card_avg_levels"] = {
+        hid: np.fromiter((s.hero_card_avg_levels.get(hid, 0.0) for s in snapshots), dtype=float)
+        for hid in card_ids
+    }
+    series["hero_xp_today"] = {
+        hid: np.fromiter((s.hero_xp_today.get(hid, 0) for s in snapshots), dtype=int)
+        for hid in sorted(hero_xp_ids)
+    }
+    series["shared_hero_xp_today"] = np.fromiter(
+        (s.shared_hero_xp_today for s in snapshots), dtype=int,
+    )
+    return series
 
 
 def render_variant_b_dashboard() -> None:
@@ -69,32 +221,34 @@ def render_variant_b_dashboard() -> None:
     if config and hasattr(config, "heroes"):
         hero_name_map = {h.hero_id: h.name for h in config.heroes}
 
+    series = _snapshot_series(result)
+
     # KPI row
-    _render_kpis(result, snapshots)
+    _render_kpis(result, series)
 
     # Charts in a 2-column grid
     col1, col2 = st.columns(2)
     with col1:
         with st.container(border=True):
-            _render_bluestar_chart(snapshots)
+            _render_bluestar_chart(series)
     with col2:
         with st.container(border=True):
-            _render_coin_chart(snapshots)
+            _render_coin_chart(series)
 
     col3, col4 = st.columns(2)
     with col3:
         with st.container(border=True):
-            _render_shared_level_chart(snapshots, hero_name_map)
+            _render_shared_level_chart(series, hero_name_map)
     with col4:
         with st.container(border=True):
-            _render_hero_card_level_chart(snapshots, hero_name_map)
+            _render_hero_card_level_chart(series, hero_name_map)
 
     with st.container(border=True):
-        _render_xp_chart(snapshots, hero_name_map)
+        _render_xp_chart(series, hero_name_map)
 
     # Chapter cadence + EndOfChapterPack rewards
     with st.container(border=True):
-        _render_chapter_chart(snapshots)
+        _render_chapter_chart(series)
         _render_pack_counts_breakdown(snapshots)
 
     # Per-hero breakdown
@@ -120,13 +274,10 @@ def render_variant_b_dashboard() -> None:
         _render_skill_tree_summary(snapshots)
 
 
-def _render_kpis(result: Any, snapshots: list) -> None:
-    chapters_total = (
-        int(getattr(snapshots[-1], "chapters_beaten_total", 0)) if snapshots else 0
-    )
-    eoc_packs_total = sum(
-        int(s.pack_counts_by_type.get("EndOfChapterPack", 0)) for s in snapshots
-    )
+def _render_kpis(result: Any, series: Dict[str, Any]) -> None:
+    chapters = series["chapters_beaten_total"]
+    chapters_total = int(chapters[-1]) if chapters.size else 0
+    eoc_packs_total = int(series["eoc_packs"].sum())
     with st.container(horizontal=True):
         st.metric("Total bluestars", f"{result.total_bluestars:,}", border=True)
         st.metric("Coins earned", f"{result.total_coins_earned:,}", border=True)
@@ -148,11 +299,11 @@ def _render_kpis(result: Any, snapshots: list) -> None:
         )
 
 
-def _render_bluestar_chart(snapshots: list) -> None:
-    days = [s.day for s in snapshots]
+def _render_bluestar_chart(series: Dict[str, Any]) -> None:
+    x, y = _downsample(series["day"], series["total_bluestars"])
     fig = _styled_fig("Bluestar accumulation")
-    fig.add_trace(go.Scatter(
-        x=days, y=[s.total_bluestars for s in snapshots],
+    fig.add_trace(_scatter(
+        x=x, y=y,
         mode="lines", name="Bluestars",
         line=dict(color=_BLUE, width=2),
         fill="tozeroy", fillcolor="rgba(37, 99, 235, 0.1)",
@@ -160,95 +311,88 @@ def _render_bluestar_chart(snapshots: list) -> None:
     st.plotly_chart(fig, width="stretch")
 
 
-def _render_shared_level_chart(snapshots: list, hero_name_map: dict | None = None) -> None:
+def _render_shared_level_chart(series: Dict[str, Any], hero_name_map: dict | None = None) -> None:
     """Per-hero level progression over time."""
-    if not snapshots or not snapshots[0].hero_levels:
+    levels_by_hero = series["hero_levels"]
+    if not levels_by_hero:
         return
-    days = [s.day for s in snapshots]
-    hero_ids = list(snapshots[-1].hero_levels.keys())
+    days = series["day"]
     hero_name_map = hero_name_map or {}
 
-    fig = _styled_fig("Hero level progression")
-    for i, hero_id in enumerate(hero_ids):
-        levels = [s.hero_levels.get(hero_id, 1) for s in snapshots]
+    traces = []
+    for i, (hero_id, hero_levels) in enumerate(levels_by_hero.items()):
+        x, levels = _downsample(days, hero_levels)
         display_name = hero_name_map.get(hero_id, hero_id.title())
-        fig.add_trace(go.Scatter(
-            x=days, y=levels, mode="lines",
+        traces.append(_scatter(
+            x=x, y=levels, mode="lines",
             name=display_name, line=dict(color=_HERO_COLORS[i % len(_HERO_COLORS)], width=2),
         ))
+    fig = _styled_fig("Hero level progression", traces)
     st.plotly_chart(fig, width="stretch")
 
 
-def _render_hero_card_level_chart(snapshots: list, hero_name_map: dict) -> None:
-    if not snapshots or not snapshots[0].hero_card_avg_levels:
+def _render_hero_card_level_chart(series: Dict[str, Any], hero_name_map: dict) -> None:
+    avgs_by_hero = series["hero_card_avg_levels"]
+    if not avgs_by_hero:
         return
-    days = [s.day for s in snapshots]
-    hero_ids = list(snapshots[-1].hero_card_avg_levels.keys())
+    days = series["day"]
 
-    fig = _styled_fig("Average hero card level")
-    for i, hero_id in enumerate(hero_ids):
-        avgs = [s.hero_card_avg_levels.get(hero_id, 0.0) for s in snapshots]
+    traces = []
+    for i, (hero_id, hero_avgs) in enumerate(avgs_by_hero.items()):
+        x, avgs = _downsample(days, hero_avgs)
         display_name = hero_name_map.get(hero_id, hero_id.title())
-        fig.add_trace(go.Scatter(
-            x=days, y=avgs, mode="lines",
+        traces.append(_scatter(
+            x=x, y=avgs, mode="lines",
             name=display_name, line=dict(color=_HERO_COLORS[i % len(_HERO_COLORS)], width=2),
         ))
+    fig = _styled_fig("Average hero card level", traces)
     st.plotly_chart(fig, width="stretch")
 
 
-def _render_xp_chart(snapshots: list, hero_name_map: dict | None = None) -> None:
+def _render_xp_chart(series: Dict[str, Any], hero_name_map: dict | None = None) -> None:
     """Stacked bar chart showing per-hero XP earned per day."""
-    if not snapshots:
+    days = series["day"]
+    if not days.size:
         return
-    days = [s.day for s in snapshots]
     hero_name_map = hero_name_map or {}
 
-    # Collect all hero_ids that earned XP at any point
-    all_hero_ids: set[str] = set()
-    for s in snapshots:
-        all_hero_ids.update(s.hero_xp_today.keys())
+    # Heroes that earned XP at any point, sorted by id
+    xp_by_hero = series["hero_xp_today"]
 
-    if not all_hero_ids:
+    if not xp_by_hero:
         # Fallback to total XP bar
-        xp = [s.shared_hero_xp_today for s in snapshots]
-        fig = _styled_fig("Daily hero XP earned")
-        fig.add_trace(go.Bar(x=days, y=xp, name="Total XP", marker_color=_VIOLET, opacity=0.8))
+        xp = series["shared_hero_xp_today"]
+        fig = _styled_fig("Daily hero XP earned", [
+            go.Bar(x=days, y=xp, name="Total XP", marker_color=_VIOLET, opacity=0.8),
+        ])
         st.plotly_chart(fig, width="stretch")
         return
 
-    fig = _styled_fig("Daily hero XP earned (per hero)")
-    for i, hero_id in enumerate(sorted(all_hero_ids)):
-        xp = [s.hero_xp_today.get(hero_id, 0) for s in snapshots]
-        display_name = hero_name_map.get(hero_id, hero_id.title())
-        fig.add_trace(go.Bar(
-            x=days, y=xp, name=display_name,
+    traces = [
+        go.Bar(
+            x=days, y=xp, name=hero_name_map.get(hero_id, hero_id.title()),
             marker_color=_HERO_COLORS[i % len(_HERO_COLORS)], opacity=0.8,
-        ))
-    fig.update_layout(barmode="stack")
+        )
+        for i, (hero_id, xp) in enumerate(xp_by_hero.items())
+    ]
+    fig = _styled_fig("Daily hero XP earned (per hero)", traces, barmode="stack")
     st.plotly_chart(fig, width="stretch")
 
 
-def _render_chapter_chart(snapshots: list) -> None:
+def _render_chapter_chart(series: Dict[str, Any]) -> None:
     """Chapters beaten over time + EndOfChapterPack callout (deterministic)."""
-    days = [s.day for s in snapshots]
-    per_day = [int(getattr(s, "chapters_beaten_today", 0)) for s in snapshots]
-    cumulative = [int(getattr(s, "chapters_beaten_total", 0)) for s in snapshots]
+    days = series["day"]
+    per_day = series["chapters_beaten_today"].astype(int)
+    cumulative = series["chapters_beaten_total"].astype(int)
     # Fallback in case chapters_beaten_total wasn't populated (older runs):
-    if cumulative and cumulative[-1] == 0 and any(per_day):
-        running = 0
-        cumulative = []
-        for c in per_day:
-            running += c
-            cumulative.append(running)
-
-    eoc_per_day = [
-        int(s.pack_counts_by_type.get("EndOfChapterPack", 0)) for s in snapshots
-    ]
-    eoc_total = sum(eoc_per_day)
-    total_chapters = cumulative[-1] if cumulative else 0
+    if cumulative.size and cumulative[-1] == 0 and per_day.any():
+        cumulative = np.cumsum(per_day)
+
+    eoc_total = int(series["eoc_packs"].sum())
+    total_chapters = int(cumulative[-1]) if cumulative.size else 0
 
-    num_days = len(snapshots) or 1
-    days_with_chapter = sum(1 for c in per_day if c > 0)
+    num_days = days.size or 1
+    days_with_chapter = int(np.count_nonzero(per_day > 0))
 
     st.markdown("**Chapter progression**")
     metric_col1, metric_col2, metric_col3 = st.columns(3)
@@ -262,19 +406,21 @@ def _render_chapter_chart(snapshots: list) -> None:
         help="Mean chapters beaten per simulated day.",
     )
 
-    fig = _styled_fig("Chapters beaten over time")
-    fig.add_trace(go.Bar(
-        x=days, y=per_day,
-        name="Chapters per day",
-        marker_color=_TEAL, opacity=0.55,
-    ))
-    fig.add_trace(go.Scatter(
-        x=days, y=cumulative,
-        mode="lines", name="Cumulative chapters",
-        line=dict(color=_VIOLET, width=2),
-        yaxis="y2",
-    ))
-    fig.update_layout(
+    fig = _styled_fig(
+        "Chapters beaten over time",
+        [
+            go.Bar(
+                x=days, y=per_day,
+                name="Chapters per day",
+                marker_color=_TEAL, opacity=0.55,
+            ),
+            _scatter(
+                x=days, y=cumulative,
+                mode="lines", name="Cumulative chapters",
+                line=dict(color=_VIOLET, width=2),
+                yaxis="y2",
+            ),
+        ],
         xaxis=dict(title="Day"),
         yaxis=dict(title="Chapters / day"),
         yaxis2=dict(title="Cumulative chapters", overlaying="y", side="right"),
@@ -301,15 +447,20 @@ def _render_pack_counts_breakdown(snapshots: list) -> None:
     if not pack_names:
         return
 
-    fig = _styled_fig("Daily pack opens by type")
     ordered = sorted(pack_names, key=lambda n: (n != "EndOfChapterPack", n))
-    for i, name in enumerate(ordered):
-        counts = [int(s.pack_counts_by_type.get(name, 0)) for s in snapshots]
-        color = _ORANGE if name == "EndOfChapterPack" else _HERO_COLORS[i % len(_HERO_COLORS)]
-        fig.add_trace(go.Bar(
-            x=days, y=counts, name=name, marker_color=color, opacity=0.85,
-        ))
-    fig.update_layout(
+    traces = [
+        go.Bar(
+            x=days,
+            y=[int(s.pack_counts_by_type.get(name, 0)) for s in snapshots],
+            name=name,
+            marker_color=_ORANGE if name == "EndOfChapterPack" else _HERO_COLORS[i % len(_HERO_COLORS)],
+            opacity=0.85,
+        )
+        for i, name in enumerate(ordered)
+    ]
+    fig = _styled_fig(
+        "Daily pack opens by type",
+        traces,
         barmode="stack",
         xaxis=dict(title="Day"),
         yaxis=dict(title="Packs opened"),
@@ -374,7 +525,7 @@ def _render_per_hero_breakdown(snapshots: list, hero_name_map: dict | None = Non
     days = [s.day for s in snapshots]
 
     # Level over time
-    fig_level = _styled_fig("Hero level over time")
+    level_traces = []
     for i, hid in enumerate(selected):
         levels = [
             (getattr(s, "hero_states", None) or {}).get(hid).level
@@ -382,12 +533,13 @@ def _render_per_hero_breakdown(snapshots: list, hero_name_map: dict | None = Non
             else None
             for s in snapshots
         ]
-        fig_level.add_trace(go.Scatter(
+        level_traces.append(_scatter(
             x=days, y=levels, mode="lines",
             name=labels.get(hid, hid),
             line=dict(color=_HERO_COLORS[options.index(hid) % len(_HERO_COLORS)], width=2),
             connectgaps=False,
         ))
+    fig_level = _styled_fig("Hero level over time", level_traces)
     st.plotly_chart(fig_level, width="stretch")
 
     # Total cards over time — stacked-by-rarity when one hero is selected,
@@ -411,33 +563,36 @@ def _render_per_hero_breakdown(snapshots: list, hero_name_map: dict | None = Non
             key=lambda r: (rarity_order_pref.index(r) if r in rarity_order_pref else len(rarity_order_pref), r),
         )
         rarity_color = {"GOLD": _AMBER, "BLUE": _BLUE, "GRAY": "#6B7280"}
-        fig_cards = _styled_fig(f"{labels.get(hid, hid)} — cards by rarity")
+        card_traces = []
         for r in rarities_seen:
             counts = [
                 ((getattr(s, "hero_states", None) or {}).get(hid).cards_by_rarity.get(r, 0)
                  if (getattr(s, "hero_states", None) or {}).get(hid) is not None else 0)
                 for s in snapshots
             ]
-            fig_cards.add_trace(go.Bar(
+            card_traces.append(go.Bar(
                 x=days, y=counts, name=r,
                 marker_color=rarity_color.get(r, _VIOLET), opacity=0.85,
             ))
-        fig_cards.update_layout(barmode="stack")
+        fig_cards = _styled_fig(
+            f"{labels.get(hid, hid)} — cards by rarity", card_traces, barmode="stack",
+        )
         st.plotly_chart(fig_cards, width="stretch")
     else:
-        fig_cards = _styled_fig("Total cards over time")
+        card_traces = []
         for hid in selected:
             totals = [
                 ((getattr(s, "hero_states", None) or {}).get(hid).total_cards
                  if (getattr(s, "hero_states", None) or {}).get(hid) is not None else None)
                 for s in snapshots
             ]
-            fig_cards.add_trace(go.Scatter(
+            card_traces.append(_scatter(
                 x=days, y=totals, mode="lines",
                 name=labels.get(hid, hid),
                 line=dict(color=_HERO_COLORS[options.index(hid) % len(_HERO_COLORS)], width=2),
                 connectgaps=False,
             ))
+        fig_cards = _styled_fig("Total cards over time", card_traces)
         st.plotly_chart(fig_cards, width="stretch")
 
     # Pet & gear progression per selected hero (Variant B). Only renders when
@@ -575,7 +730,7 @@ def _render_hero_token_hunger(
         name="Tokens spent",
         marker_color=_RED, opacity=0.55,
     ))
-    fig.add_trace(go.Scatter(
+    fig.add_trace(_scatter(
         x=days_axis, y=balance_series,
         mode="lines", name="Balance",
         line=dict(color=_VIOLET, width=2),
@@ -640,7 +795,7 @@ def _render_hero_token_demand(snapshots: list, config: Any) -> None:
         x=days_axis, y=daily,
         name="Daily demand", marker_color=_VIOLET, opacity=0.5,
     ))
-    fig.add_trace(go.Scatter(
+    fig.add_trace(_scatter(
         x=days_axis, y=cumulative,
         mode="lines", name="Cumulative demand",
         line=dict(color=_GREEN, width=2), yaxis="y2",
@@ -681,7 +836,7 @@ def _render_pet_gear_per_hero(
             )
             for s in snapshots
         ]
-        fig_pet.add_trace(go.Scatter(
+        fig_pet.add_trace(_scatter(
             x=days, y=series, mode="lines",
             name=labels.get(hid, hid),
             line=dict(color=_HERO_COLORS[options.index(hid) % len(_HERO_COLORS)], width=2),
@@ -699,7 +854,7 @@ def _render_pet_gear_per_hero(
             )
             for s in snapshots
         ]
-        fig_gear.add_trace(go.Scatter(
+        fig_gear.add_trace(_scatter(
             x=days, y=series, mode="lines",
             name=labels.get(hid, hid),
             line=dict(color=_HERO_COLORS[options.index(hid) % len(_HERO_COLORS)], width=2),
@@ -728,7 +883,7 @@ def _render_pet_gear_per_hero(
                     )
                     for s in snapshots
                 ]
-                fig_slots.add_trace(go.Scatter(
+                fig_slots.add_trace(_scatter(
                     x=days, y=series, mode="lines",
                     name=slot,
                     line=dict(color=_HERO_COLORS[i % len(_HERO_COLORS)], width=2),
@@ -783,29 +938,30 @@ def _render_mc_per_hero_breakdown(result: Any) -> None:
             if joker_series:
                 st.metric("Mean jokers", f"{joker_series[-1]:,.1f}")
 
-    fig = _styled_fig("Hero level over time (Monte Carlo)")
+    traces = []
     for i, hid in enumerate(selected):
         lvl_series = means.get(hid, [])
         std_series = stds.get(hid, [0.0] * len(lvl_series))
         days = list(range(1, len(lvl_series) + 1))
         color = _HERO_COLORS[hero_ids.index(hid) % len(_HERO_COLORS)]
         # 95% CI ribbon
-        upper = [m + 1.96 * s for m, s in zip(lvl_series, std_series)]
-        lower = [max(0.0, m - 1.96 * s) for m, s in zip(lvl_series, std_series)]
+        band_x, band_y = _ci_band(lvl_series, std_series, floor=0.0)
         # Plotly fillcolor needs rgba; we just use a translucent grey since
         # adding a per-hero rgba conversion is overkill for the use case.
-        fig.add_trace(go.Scatter(
-            x=days + days[::-1], y=upper + lower[::-1],
+        traces.append(_scatter(
+            x=band_x, y=band_y,
             fill="toself", fillcolor="rgba(120, 120, 120, 0.10)",
             line=dict(color="rgba(255,255,255,0)"),
             name=f"{labels.get(hid, hid)} 95% CI",
             hoverinfo="skip", showlegend=False,
         ))
-        fig.add_trace(go.Scatter(
-            x=days, y=lvl_series, mode="lines",
+        x, y = _downsample(days, lvl_series)
+        traces.append(_scatter(
+            x=x, y=y, mode="lines",
             name=labels.get(hid, hid),
             line=dict(color=color, width=2),
         ))
+    fig = _styled_fig("Hero level over time (Monte Carlo)", traces)
     st.plotly_chart(fig, width="stretch")
 
     # Pet level (mean line + 95% CI). Gear is summarized as a single
@@ -821,17 +977,17 @@ def _render_mc_per_hero_breakdown(result: Any) -> None:
                 continue
             days = list(range(1, len(series) + 1))
             color = _HERO_COLORS[hero_ids.index(hid) % len(_HERO_COLORS)]
-            upper = [m + 1.96 * s for m, s in zip(series, std_series)]
-            lower = [max(0.0, m - 1.96 * s) for m, s in zip(series, std_series)]
-            fig_pet.add_trace(go.Scatter(
-                x=days + days[::-1], y=upper + lower[::-1],
+            band_x, band_y = _ci_band(series, std_series, floor=0.0)
+            fig_pet.add_trace(_scatter(
+                x=band_x, y=band_y,
                 fill="toself", fillcolor="rgba(120, 120, 120, 0.10)",
                 line=dict(color="rgba(255,255,255,0)"),
                 name=f"{labels.get(hid, hid)} 95% CI",
                 hoverinfo="skip", showlegend=False,
             ))
-            fig_pet.add_trace(go.Scatter(
-                x=days, y=series, mode="lines",
+            x, y = _downsample(days, series)
+            fig_pet.add_trace(_scatter(
+                x=x, y=y, mode="lines",
                 name=labels.get(hid, hid),
                 line=dict(color=color, width=2),
             ))
@@ -846,7 +1002,7 @@ def _render_mc_per_hero_breakdown(result: Any) -> None:
                 continue
             days = list(range(1, len(series) + 1))
             color = _HERO_COLORS[hero_ids.index(hid) % len(_HERO_COLORS)]
-            fig_gear.add_trace(go.Scatter(
+            fig_gear.add_trace(_scatter(
                 x=days, y=series, mode="lines",
                 name=labels.get(hid, hid),
                 line=dict(color=color, width=2),
@@ -870,13 +1026,9 @@ def _render_mc_chapter_chart(result: Any) -> None:
 
     daily_stds = stds_by_pack.get("EndOfChapterPack", [0.0] * len(daily_means))
     days = list(range(1, len(daily_means) + 1))
-    cumulative = []
-    running = 0.0
-    for m in daily_means:
-        running += float(m)
-        cumulative.append(running)
+    cumulative = np.cumsum(np.asarray(daily_means, dtype=float))
 
-    mean_total_chapters = cumulative[-1] if cumulative else 0.0
+    mean_total_chapters = float(cumulative[-1]) if cumulative.size else 0.0
 
     with st.container(horizontal=True):
         st.metric(
@@ -890,28 +1042,29 @@ def _render_mc_chapter_chart(result: Any) -> None:
             border=True,
         )
 
-    fig = _styled_fig("Chapters beaten over time (Monte Carlo)")
-    upper = [m + 1.96 * s for m, s in zip(daily_means, daily_stds)]
-    lower = [max(0.0, m - 1.96 * s) for m, s in zip(daily_means, daily_stds)]
-    fig.add_trace(go.Scatter(
-        x=days + days[::-1], y=upper + lower[::-1],
-        fill="toself", fillcolor="rgba(13, 148, 178, 0.12)",
-        line=dict(color="rgba(255,255,255,0)"),
-        name="Per-day 95% CI",
-        hoverinfo="skip",
-    ))
-    fig.add_trace(go.Bar(
-        x=days, y=daily_means,
-        name="Mean chapters / day",
-        marker_color=_TEAL, opacity=0.55,
-    ))
-    fig.add_trace(go.Scatter(
-        x=days, y=cumulative,
-        mode="lines", name="Cumulative (mean)",
-        line=dict(color=_VIOLET, width=2),
-        yaxis="y2",
-    ))
-    fig.update_layout(
+    band_x, band_y = _ci_band(daily_means, daily_stds, floor=0.0)
+    fig = _styled_fig(
+        "Chapters beaten over time (Monte Carlo)",
+        [
+            _scatter(
+                x=band_x, y=band_y,
+                fill="toself", fillcolor="rgba(13, 148, 178, 0.12)",
+                line=dict(color="rgba(255,255,255,0)"),
+                name="Per-day 95% CI",
+                hoverinfo="skip",
+            ),
+            go.Bar(
+                x=days, y=daily_means,
+                name="Mean chapters / day",
+                marker_color=_TEAL, opacity=0.55,
+            ),
+            _scatter(
+                x=days, y=cumulative,
+                mode="lines", name="Cumulative (mean)",
+                line=dict(color=_VIOLET, width=2),
+                yaxis="y2",
+            ),
+        ],
         xaxis=dict(title="Day"),
         yaxis=dict(title="Chapters / day"),
         yaxis2=dict(title="Cumulative chapters", overlaying="y", side="right"),
@@ -923,21 +1076,24 @@ def _render_mc_chapter_chart(result: Any) -> None:
     )
 
 
-def _render_coin_chart(snapshots: list) -> None:
-    days = [s.day for s in snapshots]
+def _render_coin_chart(series: Dict[str, Any]) -> None:
+    days = series["day"]
     fig = _styled_fig("Coin economy")
-    fig.add_trace(go.Scatter(
-        x=days, y=[s.coins_earned_today for s in snapshots],
+    x, y = _downsample(days, series["coins_earned_today"])
+    fig.add_trace(_scatter(
+        x=x, y=y,
         fill="tozeroy", name="Income",
         line=dict(color=_GREEN), fillcolor="rgba(22, 163, 74, 0.1)",
     ))
-    fig.add_trace(go.Scatter(
-        x=days, y=[s.coins_spent_today for s in snapshots],
+    x, y = _downsample(days, series["coins_spent_today"])
+    fig.add_trace(_scatter(
+        x=x, y=y,
         fill="tozeroy", name="Spending",
         line=dict(color=_RED), fillcolor="rgba(220, 38, 38, 0.1)",
     ))
-    fig.add_trace(go.Scatter(
-        x=days, y=[s.coins_balance for s in snapshots],
+    x, y = _downsample(days, series["coins_balance"])
+    fig.add_trace(_scatter(
+        x=x, y=y,
         mode="lines", name="Balance",
         line=dict(color=_AMBER, width=2),
     ))
@@ -1012,15 +1168,15 @@ def _render_mc_bluestar_chart(result: Any) -> None:
     days = list(range(1, len(means) + 1))
 
     fig = _styled_fig("Bluestar accumulation (Monte Carlo)")
-    upper = [m + 1.96 * s for m, s in zip(means, stds)]
-    lower = [m - 1.96 * s for m, s in zip(means, stds)]
-    fig.add_trace(go.Scatter(
-        x=days + days[::-1], y=upper + lower[::-1],
+    band_x, band_y = _ci_band(means, stds)
+    fig.add_trace(_scatter(
+        x=band_x, y=band_y,
         fill="toself", fillcolor="rgba(37, 99, 235, 0.12)",
         line=dict(color="rgba(255,255,255,0)"), name="95% CI",
     ))
-    fig.add_trace(go.Scatter(
-        x=days, y=means, mode="lines", name="Mean bluestars",
+    x, y = _downsample(days, means)
+    fig.add_trace(_scatter(
+        x=x, y=y, mode="lines", name="Mean bluestars",
         line=dict(color=_BLUE, width=2),
     ))
     st.plotly_chart(fig, width="stretch")
@@ -1053,13 +1209,14 @@ def _render_mc_stacked_breakdown(
     n_days = max(len(means_by_key[k]) for k in keys)
     days = list(range(1, n_days + 1))
 
-    fig = _styled_fig(title)
-    for key in keys:
-        label, color = _BREAKDOWN_STYLE[key]
-        fig.add_trace(go.Bar(
-            x=days, y=means_by_key[key], name=label, marker_color=color,
-        ))
-    fig.update_layout(barmode="stack", xaxis=dict(title="Day"),
+    traces = [
+        go.Bar(
+            x=days, y=means_by_key[key],
+            name=_BREAKDOWN_STYLE[key][0], marker_color=_BREAKDOWN_STYLE[key][1],
+        )
+        for key in keys
+    ]
+    fig = _styled_fig(title, traces, barmode="stack", xaxis=dict(title="Day"),
                       yaxis=dict(title=value_label))
     st.plotly_chart(fig, width="stretch")
 
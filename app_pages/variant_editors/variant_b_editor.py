@@ -23,6 +23,7 @@ from simulation.variants.variant_b.models import (
     HeroPackType,
     PremiumPackPullRarity,
     SkillTreeNode,
+    clear_derived_caches,
 )
 
 
@@ -95,6 +96,10 @@ def render_variant_b_editor(config: HeroCardConfig) -> None:
     with tabs[14]:
         _render_import_export(config)
 
+    # Edits above land in place; drop engine lookups memoized on this config
+    # so the day simulator doesn't keep serving pre-edit values.
+    clear_derived_caches(config)
+
 
 def _render_heroes_tab(config: HeroCardConfig) -> None:
     st.subheader("Heroes & Card Pools")
@@ -5,12 +5,16 @@ Implements memory-efficient Monte Carlo runs using Welford's incremental
 mean and variance calculations. Critical for Streamlit Cloud's 1GB memory limit.
 """
 
+import multiprocessing
 import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from math import sqrt
 from random import Random
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 # Upgrade / bluestar-source breakdown keys. "type_color" where type is the
 # upgrade origin (HERO card vs SHARED card) and color is the card rarity
@@ -127,16 +131,21 @@ class DailyAccumulators:
     """
     Tracks per-day accumulators for multiple metrics.
 
-    For a simulation with N days, maintains N accumulators per metric type:
-    - bluestar_accumulators: list of N WelfordAccumulators
-    - coin_balance_accumulators: list of N WelfordAccumulators
+    Metrics sampled by every run on every day (bluestars, coin balance and the
+    fixed upgrade / bluestar-source breakdowns) are stored in preallocated
+    (num_runs, num_days) arrays and reduced with one vectorized mean/std per
+    metric in `finalize`. Metrics whose keys appear lazily (categories, pull
+    and pack types, per-hero series) keep N WelfordAccumulators per key, since
+    not every run or day contributes a sample to them:
+    - bluestar_values / coin_balance_values: (num_runs, num_days) arrays
     - category_level_accumulators: dict[category_name, list of N WelfordAccumulators]
     """
 
-    def __init__(self, num_days: int) -> None:
+    def __init__(self, num_days: int, num_runs: int = 1) -> None:
         self.num_days = num_days
-        self.bluestar_accumulators = [WelfordAccumulator() for _ in range(num_days)]
-        self.coin_balance_accumulators = [WelfordAccumulator() for _ in range(num_days)]
+        self.num_runs = num_runs
+        self.bluestar_values = np.zeros((num_runs, num_days))
+        self.coin_balance_values = np.zeros((num_runs, num_days))
         self.category_level_accumulators: Dict[str, List[WelfordAccumulator]] = {}
         self.pull_count_accumulators: Dict[str, List[WelfordAccumulator]] = {}
         self.pack_count_accumulators: Dict[str, List[WelfordAccumulator]] = {}
@@ -155,28 +164,25 @@ class DailyAccumulators:
         self.hero_gear_total_level_accumulators: Dict[str, List[WelfordAccumulator]] = {}
         # Upgrade & bluestar-source breakdowns (Variant B). Fixed key sets so
         # every run contributes a sample (0 when absent) to every per-day bucket.
-        self.upgrade_count_accumulators: Dict[str, List[WelfordAccumulator]] = {
-            key: [WelfordAccumulator() for _ in range(num_days)]
-            for key in UPGRADE_BREAKDOWN_KEYS
+        self.upgrade_count_values: Dict[str, np.ndarray] = {
+            key: np.zeros((num_runs, num_days)) for key in UPGRADE_BREAKDOWN_KEYS
         }
-        self.bluestar_source_accumulators: Dict[str, List[WelfordAccumulator]] = {
-            key: [WelfordAccumulator() for _ in range(num_days)]
-            for key in BLUESTAR_SOURCE_KEYS
+        self.bluestar_source_values: Dict[str, np.ndarray] = {
+            key: np.zeros((num_runs, num_days)) for key in BLUESTAR_SOURCE_KEYS
         }
 
-    def update_from_snapshot(self, day_index: int, snapshot: Any) -> None:
+    def update_from_snapshot(self, day_index: int, snapshot: Any, run_index: int = 0) -> None:
         """
         Update all accumulators for a given day.
 
         Args:
             day_index: 0-indexed day (day=1 -> index=0)
             snapshot: Any object satisfying DailySnapshotProtocol
+            run_index: 0-indexed Monte Carlo run the snapshot belongs to
         """
-        # Update bluestar accumulator
-        self.bluestar_accumulators[day_index].update(float(snapshot.total_bluestars))
-
-        # Update coin balance accumulator
-        self.coin_balance_accumulators[day_index].update(float(snapshot.coins_balance))
+        # Fixed per-run metrics go straight into their (run, day) cell
+        self.bluestar_values[run_index, day_index] = snapshot.total_bluestars
+        self.coin_balance_values[run_index, day_index] = snapshot.coins_balance
 
         # Update category level accumulators
         for category_name, avg_level in snapshot.category_avg_levels.items():
@@ -246,13 +252,20 @@ class DailyAccumulators:
         # day's total (0 when no events of that bucket) so means stay unbiased.
         counts, upgrade_bluestars, premium_bluestars = _breakdown_keys_from_snapshot(snapshot)
         for key in UPGRADE_BREAKDOWN_KEYS:
-            self.upgrade_count_accumulators[key][day_index].update(float(counts.get(key, 0)))
-            self.bluestar_source_accumulators[key][day_index].update(
-                float(upgrade_bluestars.get(key, 0))
+            self.upgrade_count_values[key][run_index, day_index] = counts.get(key, 0)
+            self.bluestar_source_values[key][run_index, day_index] = (
+                upgrade_bluestars.get(key, 0)
             )
-        self.bluestar_source_accumulators["PREMIUM_PACK"][day_index].update(
-            float(premium_bluestars)
-        )
+        self.bluestar_source_values["PREMIUM_PACK"][run_index, day_index] = premium_bluestars
+
+    def _array_stats(self, values: np.ndarray) -> tuple[List[float], List[float]]:
+        """Per-day (means, stds) across runs, with Bessel's correction."""
+        means = values.mean(axis=0)
+        if self.num_runs > 1:
+            stds = values.std(axis=0, ddof=1)
+        else:
+            stds = np.zeros(self.num_days)
+        return means.tolist(), stds.tolist()
 
     def finalize(self) -> Dict[str, Any]:
         """
@@ -264,21 +277,13 @@ class DailyAccumulators:
         """
         result = {}
 
-        # Extract bluestar stats
-        result["bluestar_means"] = [
-            acc.result()[0] for acc in self.bluestar_accumulators
-        ]
-        result["bluestar_stds"] = [
-            acc.result()[1] for acc in self.bluestar_accumulators
-        ]
-
-        # Extract coin balance stats
-        result["coin_balance_means"] = [
-            acc.result()[0] for acc in self.coin_balance_accumulators
-        ]
-        result["coin_balance_stds"] = [
-            acc.result()[1] for acc in self.coin_balance_accumulators
-        ]
+        # Extract bluestar and coin balance stats
+        result["bluestar_means"], result["bluestar_stds"] = self._array_stats(
+            self.bluestar_values
+        )
+        result["coin_balance_means"], result["coin_balance_stds"] = self._array_stats(
+            self.coin_balance_values
+        )
 
         # Extract category level stats
         result["category_level_means"] = {}
@@ -336,15 +341,19 @@ class DailyAccumulators:
         # Upgrade count + bluestar-source breakdowns.
         result["upgrade_count_means"] = {}
         result["upgrade_count_stds"] = {}
-        for key, accumulators in self.upgrade_count_accumulators.items():
-            result["upgrade_count_means"][key] = [acc.result()[0] for acc in accumulators]
-            result["upgrade_count_stds"][key] = [acc.result()[1] for acc in accumulators]
+        for key, values in self.upgrade_count_values.items():
+            (
+                result["upgrade_count_means"][key],
+                result["upgrade_count_stds"][key],
+            ) = self._array_stats(values)
 
         result["bluestar_source_means"] = {}
         result["bluestar_source_stds"] = {}
-        for key, accumulators in self.bluestar_source_accumulators.items():
-            result["bluestar_source_means"][key] = [acc.result()[0] for acc in accumulators]
-            result["bluestar_source_stds"][key] = [acc.result()[1] for acc in accumulators]
+        for key, values in self.bluestar_source_values.items():
+            (
+                result["bluestar_source_means"][key],
+                result["bluestar_source_stds"][key],
+            ) = self._array_stats(values)
 
         return result
 
@@ -389,10 +398,59 @@ class MCResult:
     completion_time: float = 0.0
 
 
+def _run_seeded(run_fn: Any, config: Any, run_idx: int) -> Tuple[int, list]:
+    """Run one seeded simulation and keep only what aggregation needs.
+
+    Module-level so it can be shipped to worker processes; the pull log and
+    the rest of the result are dropped in the worker instead of pickled back.
+    """
+    result = run_fn(config, rng=Random(run_idx))
+    return result.total_bluestars, result.daily_snapshots
+
+
+# Per-worker (run_fn, config), installed once by `_init_worker` so pool tasks
+# only carry a run index instead of re-pickling the config every time.
+_worker_run: Optional[Tuple[Any, Any]] = None
+
+
+def _init_worker(run_fn: Any, config: Any) -> None:
+    global _worker_run
+    _worker_run = (run_fn, config)
+
+
+def _run_in_worker(run_idx: int) -> Tuple[int, list]:
+    run_fn, config = _worker_run
+    return _run_seeded(run_fn, config, run_idx)
+
+
+def _iter_runs(
+    config: Any, num_runs: int, run_fn: Any, max_workers: int,
+) -> Iterator[Tuple[int, list]]:
+    """Yield (total_bluestars, daily_snapshots) for runs 1..num_runs, in order."""
+    run_ids = range(1, num_runs + 1)
+    workers = min(max_workers, num_runs)
+    if workers <= 1:
+        for run_idx in run_ids:
+            yield _run_seeded(run_fn, config, run_idx)
+        return
+
+    # "spawn" rather than fork: the Streamlit server is multi-threaded, and
+    # forking a threaded process can deadlock the child.
+    chunksize = max(1, num_runs // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(run_fn, config),
+    ) as pool:
+        yield from pool.map(_run_in_worker, run_ids, chunksize=chunksize)
+
+
 def run_monte_carlo(
     config: Any,
     num_runs: int = 100,
     run_fn: Any = None,
+    max_workers: int = 1,
 ) -> MCResult:
     """
     Run Monte Carlo simulation with Welford statistics.
@@ -409,6 +467,10 @@ def run_monte_carlo(
         num_runs: Number of Monte Carlo runs (default 100)
         run_fn: Simulation callable (config, rng=) -> SimResultProtocol.
                 Required — callers pass the active variant's run_simulation.
+                Must be a module-level function when max_workers > 1.
+        max_workers: Worker processes to spread runs across (default 1 =
+                run in-process). Seeds and aggregation order are the same
+                either way, so results are identical.
 
     Returns:
         MCResult with aggregated statistics across all runs
@@ -434,21 +496,23 @@ def run_monte_carlo(
 
     # Initialize accumulators
     final_bluestar_accumulator = WelfordAccumulator()
-    daily_accumulators = DailyAccumulators(config.num_days)
-
-    # Run Monte Carlo simulations
-    for run_idx in range(1, num_runs + 1):
-        rng = Random(run_idx)
-        result = run_fn(config, rng=rng)
-
+    daily_accumulators = DailyAccumulators(config.num_days, num_runs)
+
+    # Run Monte Carlo simulations (results are consumed in run order, so
+    # the Welford updates see the same sequence with or without workers)
+    # Aggregation only reads snapshots, so skip building per-pull logs.
+    if getattr(config, "log_pulls", False):
+        config = config.model_copy(update={"log_pulls": False})
+    runs = _iter_runs(config, num_runs, run_fn, max_workers)
+    for run_idx, (total_bluestars, daily_snapshots) in enumerate(runs):
         # Update final bluestar accumulator
-        final_bluestar_accumulator.update(float(result.total_bluestars))
+        final_bluestar_accumulator.update(float(total_bluestars))
 
         # Update daily accumulators
-        for day_idx, snapshot in enumerate(result.daily_snapshots):
-            daily_accumulators.update_from_snapshot(day_idx, snapshot)
+        for day_idx, snapshot in enumerate(daily_snapshots):
+            daily_accumulators.update_from_snapshot(day_idx, snapshot, run_index=run_idx)
 
-        # DO NOT STORE result — let it be garbage collected immediately
+        # DO NOT STORE results — let them be garbage collected immediately
 
     # Finalize daily statistics
     daily_stats = daily_accumulators.finalize()
@@ -5,11 +5,12 @@ Captures every card pull event with the selected card, duplicates received,
 coins earned, and any upgrades that fired immediately after the pull.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class VariantBUpgradeEvent:
     """Adapter for Variant B upgrade dicts — matches UpgradeEvent interface."""
 
@@ -25,7 +26,7 @@ class VariantBUpgradeEvent:
     xp_earned: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PullEvent:
     """A single card pull with its immediate consequences."""
 
@@ -40,7 +41,9 @@ class PullEvent:
     coins_earned: int
     pack_name: str  # which pack this pull came from
     bluestars_earned: int  # total bluestars from upgrades after this pull
-    upgrades: list[Any] = field(default_factory=list)
+    # Most pulls trigger no upgrades; they share the empty tuple, and the
+    # orchestrator assigns a list only to a day's last pull when upgrades fire.
+    upgrades: Sequence[Any] = ()
 
 
 @dataclass
@@ -63,7 +66,7 @@ class PullLogger:
         coins_earned: int,
         pack_name: str,
         bluestars_earned: int,
-        upgrades: list[Any],
+        upgrades: Sequence[Any] = (),
     ) -> None:
         self.events.append(
             PullEvent(
@@ -81,3 +84,20 @@ class PullLogger:
                 upgrades=upgrades,
             )
         )
+
+
+class NullPullLogger:
+    """Drop-in for PullLogger when per-pull logs aren't wanted.
+
+    `log_pull` builds nothing and `events` is always empty, so a run that
+    won't read its pull log skips every PullEvent allocation.
+    """
+
+    __slots__ = ()
+
+    @property
+    def events(self) -> list[PullEvent]:
+        return []
+
+    def log_pull(self, **_kwargs: Any) -> None:
+        pass
@@ -2,20 +2,28 @@
 URL configuration encoding/decoding for shareable simulation configs.
 
 Provides URL-safe compression and encoding of SimConfig objects for team collaboration.
-Process: JSON → bytes → gzip → base64url → string
+Process: JSON → bytes → xz (LZMA2) → base64url → string
+
+Links created before the switch to xz are gzip streams; `decode_config` tells
+the two apart by the container's magic bytes, so old shared URLs still open.
 """
 
 import base64
 import gzip
+import lzma
+from functools import lru_cache
 
 from simulation.models import SimConfig
 
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
 
 def encode_config(config: SimConfig) -> str:
     """
     Encode SimConfig to URL-safe string.
 
-    Process: JSON → bytes → gzip → base64url → string
+    Process: JSON → bytes → xz → base64url → string
 
     Args:
         config: SimConfig object to encode
@@ -23,8 +31,19 @@ def encode_config(config: SimConfig) -> str:
     Returns:
         URL-safe base64-encoded string
     """
-    json_bytes = config.model_dump_json().encode("utf-8")
-    compressed = gzip.compress(json_bytes, compresslevel=6)
+    return _encode_json(config.model_dump_json())
+
+
+@lru_cache(maxsize=32)
+def _encode_json(json_str: str) -> str:
+    """xz + base64url a config's JSON dump.
+
+    LZMA2 yields links well under half the length of gzip level 6 for the
+    default config; its slower encode is paid once per distinct config, since
+    this is memoized on the JSON text (Streamlit re-encodes the same config on
+    every rerun).
+    """
+    compressed = lzma.compress(json_str.encode("utf-8"), format=lzma.FORMAT_XZ)
     encoded = base64.urlsafe_b64encode(compressed)
     return encoded.decode("ascii")
 
@@ -33,7 +52,7 @@ def decode_config(encoded: str) -> SimConfig:
     """
     Decode URL-safe string to SimConfig.
 
-    Process: string → base64url decode → gzip decompress → JSON → SimConfig
+    Process: string → base64url decode → xz (or legacy gzip) decompress → JSON bytes → SimConfig
 
     Args:
         encoded: URL-safe base64-encoded string
@@ -45,9 +64,14 @@ def decode_config(encoded: str) -> SimConfig:
         ValueError: If decoding fails due to corruption or invalid format
     """
     try:
-        decoded = base64.urlsafe_b64decode(encoded.encode("ascii"))
-        decompressed = gzip.decompress(decoded)
-        json_str = decompressed.decode("utf-8")
-        return SimConfig.model_validate_json(json_str)
+        decoded = base64.urlsafe_b64decode(encoded)
+        if decoded.startswith(_XZ_MAGIC):
+            decompressed = lzma.decompress(decoded, format=lzma.FORMAT_XZ)
+        elif decoded.startswith(_GZIP_MAGIC):
+            decompressed = gzip.decompress(decoded)
+        else:
+            raise ValueError("unrecognized compression format")
+        # Pydantic parses UTF-8 JSON bytes directly; no intermediate str copy.
+        return SimConfig.model_validate_json(decompressed)
     except Exception as e:
         raise ValueError(f"Failed to decode config: {e}") from e
@@ -13,6 +13,7 @@ orchestrator's `_get_daily_pulls`.
 from __future__ import annotations
 
 import json
+from bisect import bisect_right
 from pathlib import Path
 from typing import List
 
@@ -56,6 +57,8 @@ def chapters_for_bluestars(
     thresholds: List[float],
     total_bluestars: int | float,
     already_beaten: int,
+    *,
+    ascending: bool = False,
 ) -> int:
     """How many *additional* chapters can be beaten given the player's
     current bluestars and how many they have already beaten.
@@ -70,16 +73,23 @@ def chapters_for_bluestars(
     are awarded while bluestars cover that step. With a single-entry
     table or a flat tail (step <= 0) extrapolation is disabled and the
     count saturates at `len(thresholds)`.
+
+    Callers that have checked the table is non-decreasing (every shipped
+    cohort is) pass `ascending=True` to bisect instead of scanning; the
+    count is the same either way for such tables.
     """
     if not thresholds:
         return 0
     bs = float(total_bluestars)
-    target = 0
-    for thresh in thresholds:
-        if bs >= float(thresh):
-            target += 1
-        else:
-            break
+    if ascending:
+        target = bisect_right(thresholds, bs)
+    else:
+        target = 0
+        for thresh in thresholds:
+            if bs >= float(thresh):
+                target += 1
+            else:
+                break
 
     # Linear extrapolation past the configured table.
     if target == len(thresholds) and len(thresholds) >= 2:
@@ -19,6 +19,7 @@ from simulation.variants.variant_b.models import (
     HeroCardConfig,
     HeroCardGameState,
     HeroPackType,
+    enum_value,
 )
 from simulation.variants.variant_b.hero_deck import (
     get_unlocked_cards,
@@ -305,7 +306,7 @@ def open_pack_by_name(
             shared_card = select_shared_card(game_state, config, rng)
             if shared_card:
                 level_before = shared_card.level
-                cat = shared_card.category.value if hasattr(shared_card.category, "value") else str(shared_card.category)
+                cat = enum_value(shared_card.category)
                 meta = compute_shared_duplicates_meta(
                     shared_card.level, cat, config, rng, boost=shared_boost
                 )
@@ -8,8 +8,10 @@ For hero cards: bucket heroes by level -> pick bucket -> pick hero (anti-streak)
 from __future__ import annotations
 
 import hashlib
+from bisect import bisect_left
+from itertools import accumulate
 from random import Random
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from simulation.variants.variant_b.models import (
     HeroCardConfig,
@@ -21,6 +23,7 @@ from simulation.variants.variant_b.models import (
     HeroUpgradeCostTable,
     SharedDuplicateRange,
     SharedUpgradeCostTable,
+    enum_value,
 )
 from simulation.variants.variant_b.hero_deck import get_unlocked_cards
 
@@ -42,17 +45,25 @@ def _weighted_choice(
         return None
 
     if rng:
+        # First item whose running weight total reaches the roll. accumulate +
+        # bisect keep the scan in C; the running sums are built left to right
+        # exactly like a manual loop, so seeded picks are unchanged. Weights
+        # are non-negative, so the running totals are sorted.
         roll = rng.random() * total
-        cumulative = 0.0
-        for item, w in zip(items, weights):
-            cumulative += w
-            if roll <= cumulative:
-                return item
-        return items[-1]
+        idx = bisect_left(list(accumulate(weights)), roll)
+        return items[idx] if idx < len(items) else items[-1]
     else:
-        # Deterministic: pick highest weight
-        best_idx = max(range(len(weights)), key=lambda i: weights[i])
-        return items[best_idx]
+        # Deterministic: pick highest weight (first one on ties)
+        return items[weights.index(max(weights))]
+
+
+# Anti-streak axis -> (last_value field, streak_count field) on HeroCardGameState.
+_STREAK_FIELDS: Dict[str, Tuple[str, str]] = {
+    "hero": ("last_hero_pulled", "hero_streak_count"),
+    "rarity": ("last_rarity_pulled", "rarity_streak_count"),
+    "card": ("last_card_pulled", "card_streak_count"),
+    "shared": ("last_shared_category", "shared_category_streak_count"),
+}
 
 
 def _bump_streak(game_state: HeroCardGameState, axis: str, value: str) -> None:
@@ -60,13 +71,12 @@ def _bump_streak(game_state: HeroCardGameState, axis: str, value: str) -> None:
 
     Increments the count when `value` repeats the last pick on this axis,
     otherwise resets the run to 1. Mirrors the New Algo's per-axis StreakX.
+
+    Streak state lives directly on ``game_state`` and is updated in place —
+    nothing is copied per pull, so callers that need a before/after view of
+    the streaks must read the fields themselves before the pick.
     """
-    last_attr, count_attr = {
-        "hero": ("last_hero_pulled", "hero_streak_count"),
-        "rarity": ("last_rarity_pulled", "rarity_streak_count"),
-        "card": ("last_card_pulled", "card_streak_count"),
-        "shared": ("last_shared_category", "shared_category_streak_count"),
-    }[axis]
+    last_attr, count_attr = _STREAK_FIELDS[axis]
     if getattr(game_state, last_attr) == value:
         setattr(game_state, count_attr, getattr(game_state, count_attr) + 1)
     else:
@@ -74,6 +84,32 @@ def _bump_streak(game_state: HeroCardGameState, axis: str, value: str) -> None:
         setattr(game_state, count_attr, 1)
 
 
+def _streak_penalty(decay: float, streak: int) -> Optional[float]:
+    """Anti-streak multiplier ``decay ** streak``, or None when no streak is live.
+
+    Evaluated once per pick rather than once per matching candidate; short
+    runs (the common case) come from a small precomputed power table.
+    """
+    if streak <= 0:
+        return None
+    if streak < _DECAY_TABLE_SIZE:
+        return _decay_powers(decay)[streak]
+    return decay ** streak
+
+
+_DECAY_TABLE_SIZE = 16
+_decay_power_tables: Dict[float, Tuple[float, ...]] = {}
+
+
+def _decay_powers(decay: float) -> Tuple[float, ...]:
+    """``(decay ** 0, decay ** 1, ...)`` for one decay factor, built on first use."""
+    table = _decay_power_tables.get(decay)
+    if table is None:
+        table = tuple(decay ** i for i in range(_DECAY_TABLE_SIZE))
+        _decay_power_tables[decay] = table
+    return table
+
+
 # ---------------------------------------------------------------------------
 # Hero vs Shared decision (unchanged logic)
 # ---------------------------------------------------------------------------
@@ -94,16 +130,42 @@ def decide_hero_or_shared(
     if rng:
         roll = rng.random()
     else:
-        # Deterministic: hash on (day, pull_index) so consecutive pulls within
-        # a day don't all return the same decision.
-        h = hashlib.md5(
-            f"hero_or_shared_{game_state.day}_{pull_index}".encode()
-        )
-        roll = int(h.hexdigest()[:8], 16) / 0xFFFFFFFF
+        roll = _hero_or_shared_hash_roll(game_state.day, pull_index)
 
     return "hero" if roll < base_hero else "shared"
 
 
+def _hero_or_shared_hash_roll(day: int, pull_index: int) -> float:
+    """Deterministic roll in [0, 1]: hash on (day, pull_index) so consecutive
+    pulls within a day don't all return the same decision."""
+    h = hashlib.md5(f"hero_or_shared_{day}_{pull_index}".encode())
+    return int(h.hexdigest()[:8], 16) / 0xFFFFFFFF
+
+
+def make_hero_or_shared_decider(
+    config: HeroCardConfig,
+    rng: Optional[Random] = None,
+) -> Callable[[int, int], str]:
+    """Bind `decide_hero_or_shared` to one run's config and RNG.
+
+    Returns `decide(day, pull_index) -> "hero" | "shared"`, equivalent to
+    calling `decide_hero_or_shared` with the same arguments. The base rate and
+    the RNG-vs-hash branch are resolved once here instead of on every pull.
+    """
+    base_hero = config.drop_config.hero_vs_shared_base_rate
+
+    if rng:
+        rand = rng.random
+
+        def decide(day: int, pull_index: int) -> str:
+            return "hero" if rand() < base_hero else "shared"
+    else:
+        def decide(day: int, pull_index: int) -> str:
+            return "hero" if _hero_or_shared_hash_roll(day, pull_index) < base_hero else "shared"
+
+    return decide
+
+
 # ---------------------------------------------------------------------------
 # Hero card selection — bucket-based algorithm
 # ---------------------------------------------------------------------------
@@ -127,6 +189,54 @@ def _build_hero_buckets(
     return bottom, middle, top
 
 
+def _rarity_weights(
+    game_state: HeroCardGameState,
+    config: HeroCardConfig,
+    available: Any,
+) -> Tuple[List[HeroCardRarity], List[float]]:
+    """Rarities present in `available` (GRAY, BLUE, GOLD order) and their
+    streak-adjusted roll weights:
+    FinalWeightRarity = rarity_weight * streak_decay_rarity ^ StreakColor
+    """
+    dc = config.drop_config
+    rarity_penalty = _streak_penalty(dc.streak_decay_rarity, game_state.rarity_streak_count)
+    rarities: List[HeroCardRarity] = []
+    weights: List[float] = []
+    for rarity, weight in (
+        (HeroCardRarity.GRAY, dc.rarity_weight_gray),
+        (HeroCardRarity.BLUE, dc.rarity_weight_blue),
+        (HeroCardRarity.GOLD, dc.rarity_weight_gold),
+    ):
+        if rarity in available:
+            if rarity_penalty is not None and rarity == game_state.last_rarity_pulled:
+                weight *= rarity_penalty
+            rarities.append(rarity)
+            weights.append(weight)
+    return rarities, weights
+
+
+def compute_rarity_probabilities(
+    game_state: HeroCardGameState,
+    config: HeroCardConfig,
+    hero_id: str,
+) -> Dict[HeroCardRarity, float]:
+    """Probability of each rarity on the next seeded rarity roll for `hero_id`.
+
+    Step 4 of `select_hero_card` (given the hero was picked), normalized.
+    Empty when the hero is missing or has no unlocked cards with positive
+    weight.
+    """
+    hero_state = game_state.heroes.get(hero_id)
+    if hero_state is None:
+        return {}
+    available = {card.rarity for card in get_unlocked_cards(hero_state)}
+    rarities, weights = _rarity_weights(game_state, config, available)
+    total = sum(weights)
+    if total <= 0:
+        return {}
+    return {rarity: weight / total for rarity, weight in zip(rarities, weights)}
+
+
 def select_hero_card(
     game_state: HeroCardGameState,
     config: HeroCardConfig,
@@ -145,11 +255,15 @@ def select_hero_card(
     """
     dc = config.drop_config
 
-    # Step 1: Collect heroes that have at least one unlocked card, sorted by level
+    # Step 1: Collect heroes that have at least one unlocked card, sorted by level.
+    # Unlocked decks are kept for step 4 instead of being filtered again.
     eligible_heroes: List[Tuple[str, HeroProgressState]] = []
+    unlocked_by_hero: Dict[str, List[HeroCardState]] = {}
     for hero_id, hero_state in game_state.heroes.items():
-        if get_unlocked_cards(hero_state):
+        unlocked = get_unlocked_cards(hero_state)
+        if unlocked:
             eligible_heroes.append((hero_id, hero_state))
+            unlocked_by_hero[hero_id] = unlocked
 
     if not eligible_heroes:
         return None
@@ -180,11 +294,12 @@ def select_hero_card(
     # Step 3: Pick hero from bucket.
     #   WeightHero = 1/(level+1)  (lowest-level heroes favoured within the bucket)
     #   FinalWeightHero = WeightHero * streak_decay_hero ^ StreakHero
+    hero_penalty = _streak_penalty(dc.streak_decay_hero, game_state.hero_streak_count)
     hero_weights = []
     for hero_id, hero_state in chosen_bucket:
         w = 1.0 / (hero_state.level + 1)
-        if hero_id == game_state.last_hero_pulled and game_state.hero_streak_count > 0:
-            w *= dc.streak_decay_hero ** game_state.hero_streak_count
+        if hero_penalty is not None and hero_id == game_state.last_hero_pulled:
+            w *= hero_penalty
         hero_weights.append(w)
 
     chosen_hero = _weighted_choice(chosen_bucket, hero_weights, rng)
@@ -194,26 +309,13 @@ def select_hero_card(
 
     # Step 4: Roll rarity (only from rarities this hero has unlocked cards for).
     #   FinalWeightRarity = rarity_weight * streak_decay_rarity ^ StreakColor
-    unlocked = get_unlocked_cards(hero_state)
     cards_by_rarity: Dict[HeroCardRarity, List[HeroCardState]] = {}
-    for card in unlocked:
+    for card in unlocked_by_hero[hero_id]:
         cards_by_rarity.setdefault(card.rarity, []).append(card)
 
-    rarity_config = [
-        (HeroCardRarity.GRAY, dc.rarity_weight_gray),
-        (HeroCardRarity.BLUE, dc.rarity_weight_blue),
-        (HeroCardRarity.GOLD, dc.rarity_weight_gold),
-    ]
-
-    available_rarities = []
-    available_rarity_weights = []
-    for rarity, weight in rarity_config:
-        if rarity in cards_by_rarity:
-            if rarity.value == game_state.last_rarity_pulled and game_state.rarity_streak_count > 0:
-                weight *= dc.streak_decay_rarity ** game_state.rarity_streak_count
-            available_rarities.append(rarity)
-            available_rarity_weights.append(weight)
-
+    available_rarities, available_rarity_weights = _rarity_weights(
+        game_state, config, cards_by_rarity,
+    )
     if not available_rarities:
         return None
 
@@ -225,12 +327,20 @@ def select_hero_card(
     #   WeightCard = 1/(level+1) (lowest-level-first catch-up)
     #   FinalWeightCard = WeightCard * streak_decay_card ^ StreakCard
     rarity_cards = cards_by_rarity[chosen_rarity]
+    card_penalty = _streak_penalty(dc.streak_decay_card, game_state.card_streak_count)
+    # last_card_pulled is "hero_id:card_id"; split it once rather than
+    # formatting a key for every candidate card.
+    streak_card_id = None
+    last_card = game_state.last_card_pulled
+    if card_penalty is not None and last_card:
+        prefix = f"{hero_id}:"
+        if last_card.startswith(prefix):
+            streak_card_id = last_card[len(prefix):]
     card_weights = []
     for card in rarity_cards:
         w = 1.0 / (card.level + 1)
-        card_key = f"{hero_id}:{card.card_id}"
-        if card_key == game_state.last_card_pulled and game_state.card_streak_count > 0:
-            w *= dc.streak_decay_card ** game_state.card_streak_count
+        if card.card_id == streak_card_id:
+            w *= card_penalty
         card_weights.append(w)
 
     chosen_card = _weighted_choice(rarity_cards, card_weights, rng)
@@ -240,8 +350,12 @@ def select_hero_card(
     # Update anti-streak trackers for all three axes (the algorithm owns this,
     # so callers must NOT update streak state themselves).
     _bump_streak(game_state, "hero", hero_id)
-    _bump_streak(game_state, "rarity", chosen_rarity.value)
-    _bump_streak(game_state, "card", f"{hero_id}:{chosen_card.card_id}")
+    _bump_streak(game_state, "rarity", enum_value(chosen_rarity))
+    if streak_card_id is not None and chosen_card.card_id == streak_card_id:
+        # Same card again: extend the run without formatting a new key.
+        game_state.card_streak_count += 1
+    else:
+        _bump_streak(game_state, "card", f"{hero_id}:{chosen_card.card_id}")
 
     return hero_id, chosen_card.card_id
 
@@ -252,8 +366,7 @@ def select_hero_card(
 
 def _shared_category(card: Any) -> str:
     """Category string of a shared card, tolerant of enum or raw value."""
-    cat = getattr(card, "category", None)
-    return cat.value if hasattr(cat, "value") else str(cat)
+    return enum_value(getattr(card, "category", None))
 
 
 def select_shared_card(
@@ -283,12 +396,17 @@ def select_shared_card(
         return None
 
     # Step 2: catch-up weight with color anti-streak.
-    decay = config.drop_config.streak_decay_shared
+    penalty = _streak_penalty(
+        config.drop_config.streak_decay_shared, game_state.shared_category_streak_count,
+    )
+    # CardCategory is a str enum, so members compare equal to the stored
+    # category value directly — no per-candidate value lookup.
+    last_category = game_state.last_shared_category
     weights = []
     for c in candidates:
         w = 1.0 / (c.level + 1)
-        if _shared_category(c) == game_state.last_shared_category and game_state.shared_category_streak_count > 0:
-            w *= decay ** game_state.shared_category_streak_count
+        if penalty is not None and c.category == last_category:
+            w *= penalty
         weights.append(w)
 
     chosen = _weighted_choice(candidates, weights, rng)
@@ -330,33 +448,24 @@ def _find_upgrade_table(
     return cache.get(rarity)
 
 
-def compute_hero_duplicates_meta(
+def _roll_dupes(
+    dupe_range: Any,
+    upgrade_table: Any,
     card_level: int,
-    card_rarity: HeroCardRarity,
-    config: HeroCardConfig,
-    rng: Optional[Random] = None,
-    boost: float = 0.0,
-) -> Dict[str, Any]:
-    """Compute duplicates received with full sanity-check metadata.
+    rng: Optional[Random],
+    boost: float,
+) -> Tuple[int, float, int, float]:
+    """Roll one pull's duplicates -> (dupes, pct, base_cost, effective_pct).
 
-    Returns dict with:
-        dupes: final dupe count granted
-        pct: the raw rolled % of next-level cost (before boost)
-        boost: per-pack additive multiplier applied
-        base_cost: dupe cost to reach the next level (denominator)
-        effective_pct: pct * (1 + boost) — what fraction of next-level cost
-            this single pull actually covered.
+    Shared by the hero and shared-card paths. Returns a plain tuple so the
+    per-pull callers that only want the count don't build a metadata dict.
     """
-    dupe_range = _find_dupe_range(config, card_rarity)
-    upgrade_table = _find_upgrade_table(config, card_rarity)
-
     if not dupe_range or not upgrade_table:
-        return {"dupes": 1, "pct": 0.0, "boost": boost, "base_cost": 0, "effective_pct": 0.0}
+        return 1, 0.0, 0, 0.0
 
     level_idx = card_level - 1
-
     if level_idx >= len(upgrade_table.duplicate_costs) or level_idx >= len(dupe_range.min_pct):
-        return {"dupes": 0, "pct": 0.0, "boost": boost, "base_cost": 0, "effective_pct": 0.0}
+        return 0, 0.0, 0, 0.0
 
     base_cost = upgrade_table.duplicate_costs[level_idx]
     min_pct = dupe_range.min_pct[level_idx]
@@ -368,7 +477,11 @@ def compute_hero_duplicates_meta(
         pct = (min_pct + max_pct) / 2.0
 
     effective_pct = pct * (1.0 + boost)
-    dupes = max(1, round(base_cost * effective_pct))
+    return max(1, round(base_cost * effective_pct)), pct, base_cost, effective_pct
+
+
+def _dupe_roll_meta(roll: Tuple[int, float, int, float], boost: float) -> Dict[str, Any]:
+    dupes, pct, base_cost, effective_pct = roll
     return {
         "dupes": dupes,
         "pct": pct,
@@ -378,6 +491,33 @@ def compute_hero_duplicates_meta(
     }
 
 
+def compute_hero_duplicates_meta(
+    card_level: int,
+    card_rarity: HeroCardRarity,
+    config: HeroCardConfig,
+    rng: Optional[Random] = None,
+    boost: float = 0.0,
+) -> Dict[str, Any]:
+    """Compute duplicates received with full sanity-check metadata.
+
+    Returns dict with:
+        dupes: final dupe count granted
+        pct: the raw rolled % of next-level cost (before boost)
+        boost: per-pack additive multiplier applied
+        base_cost: dupe cost to reach the next level (denominator)
+        effective_pct: pct * (1 + boost) — what fraction of next-level cost
+            this single pull actually covered.
+    """
+    return _dupe_roll_meta(
+        _roll_dupes(
+            _find_dupe_range(config, card_rarity),
+            _find_upgrade_table(config, card_rarity),
+            card_level, rng, boost,
+        ),
+        boost,
+    )
+
+
 def compute_hero_duplicates(
     card_level: int,
     card_rarity: HeroCardRarity,
@@ -393,7 +533,11 @@ def compute_hero_duplicates(
     +10% unique-card dupes → boost=0.10 → final dupes scaled by 1.10).
     Returns at least 1 dupe. Returns 0 if card is already at max level.
     """
-    return compute_hero_duplicates_meta(card_level, card_rarity, config, rng, boost)["dupes"]
+    return _roll_dupes(
+        _find_dupe_range(config, card_rarity),
+        _find_upgrade_table(config, card_rarity),
+        card_level, rng, boost,
+    )[0]
 
 
 def get_coins_per_dupe(
@@ -401,13 +545,31 @@ def get_coins_per_dupe(
     card_rarity: HeroCardRarity,
     config: HeroCardConfig,
 ) -> int:
-    """Look up coins earned per duplicate for a given card level and rarity."""
-    dupe_range = _find_dupe_range(config, card_rarity)
+    """Look up coins earned per duplicate for a given card level and rarity.
+
+    Results are memoized per (rarity, level) on the config — called on
+    every hero pull.
+    """
+    cache = getattr(config, "_hero_coins_per_dupe_cache", None)
+    if cache is None:
+        cache = {}
+        object.__setattr__(config, "_hero_coins_per_dupe_cache", cache)
+    key = (card_rarity, card_level)
+    coins = cache.get(key)
+    if coins is None:
+        coins = cache[key] = _coins_per_dupe_at(
+            _find_dupe_range(config, card_rarity), card_level,
+        )
+    return coins
+
+
+def _coins_per_dupe_at(dupe_range: Any, card_level: int) -> int:
+    """Coins-per-dupe at ``card_level``, clamped to the table's last entry."""
     if not dupe_range or not dupe_range.coins_per_dupe:
         return 5  # fallback
     level_idx = card_level - 1
     if level_idx >= len(dupe_range.coins_per_dupe):
-        return dupe_range.coins_per_dupe[-1] if dupe_range.coins_per_dupe else 5
+        return dupe_range.coins_per_dupe[-1]
     return dupe_range.coins_per_dupe[level_idx]
 
 
@@ -463,34 +625,14 @@ def compute_shared_duplicates_meta(
 
     See compute_hero_duplicates_meta for field semantics.
     """
-    dupe_range = _find_shared_dupe_range(config, card_category)
-    upgrade_table = _find_shared_upgrade_table(config, card_category)
-
-    if not dupe_range or not upgrade_table:
-        return {"dupes": 1, "pct": 0.0, "boost": boost, "base_cost": 0, "effective_pct": 0.0}
-
-    level_idx = card_level - 1
-    if level_idx >= len(upgrade_table.duplicate_costs) or level_idx >= len(dupe_range.min_pct):
-        return {"dupes": 0, "pct": 0.0, "boost": boost, "base_cost": 0, "effective_pct": 0.0}
-
-    base_cost = upgrade_table.duplicate_costs[level_idx]
-    min_pct = dupe_range.min_pct[level_idx]
-    max_pct = dupe_range.max_pct[level_idx]
-
-    if rng:
-        pct = rng.uniform(min_pct, max_pct)
-    else:
-        pct = (min_pct + max_pct) / 2.0
-
-    effective_pct = pct * (1.0 + boost)
-    dupes = max(1, round(base_cost * effective_pct))
-    return {
-        "dupes": dupes,
-        "pct": pct,
-        "boost": boost,
-        "base_cost": base_cost,
-        "effective_pct": effective_pct,
-    }
+    return _dupe_roll_meta(
+        _roll_dupes(
+            _find_shared_dupe_range(config, card_category),
+            _find_shared_upgrade_table(config, card_category),
+            card_level, rng, boost,
+        ),
+        boost,
+    )
 
 
 def compute_shared_duplicates(
@@ -506,7 +648,11 @@ def compute_shared_duplicates(
     `boost` is the source pack's shared-card boost (e.g. T4 → +25% → boost=0.25).
     Returns at least 1. Returns 0 if at max level.
     """
-    return compute_shared_duplicates_meta(card_level, card_category, config, rng, boost)["dupes"]
+    return _roll_dupes(
+        _find_shared_dupe_range(config, card_category),
+        _find_shared_upgrade_table(config, card_category),
+        card_level, rng, boost,
+    )[0]
 
 
 def get_shared_coins_per_dupe(
@@ -514,11 +660,15 @@ def get_shared_coins_per_dupe(
     card_category: str,
     config: HeroCardConfig,
 ) -> int:
-    """Look up coins earned per duplicate for a shared card."""
-    dupe_range = _find_shared_dupe_range(config, card_category)
-    if not dupe_range or not dupe_range.coins_per_dupe:
-        return 5
-    level_idx = card_level - 1
-    if level_idx >= len(dupe_range.coins_per_dupe):
-        return dupe_range.coins_per_dupe[-1] if dupe_range.coins_per_dupe else 5
-    return dupe_range.coins_per_dupe[level_idx]
+    """Look up coins earned per duplicate for a shared card (memoized)."""
+    cache = getattr(config, "_shared_coins_per_dupe_cache", None)
+    if cache is None:
+        cache = {}
+        object.__setattr__(config, "_shared_coins_per_dupe_cache", cache)
+    key = (card_category, card_level)
+    coins = cache.get(key)
+    if coins is None:
+        coins = cache[key] = _coins_per_dupe_at(
+            _find_shared_dupe_range(config, card_category), card_level,
+        )
+    return coins
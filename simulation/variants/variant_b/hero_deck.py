@@ -5,7 +5,7 @@ Handles hero initialization, card unlocking via skill tree, and pool queries.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from simulation.variants.variant_b.models import (
     HeroCardConfig,
@@ -16,6 +16,26 @@ from simulation.variants.variant_b.models import (
 )
 
 
+def _hero_unlock_entries(config: HeroCardConfig) -> List[Tuple[int, List[HeroDef]]]:
+    """`hero_unlock_schedule` as (int threshold, hero defs), in schedule order.
+
+    Memoized on the config: thresholds are parsed and hero ids resolved to
+    their definitions once (first definition per id, unknown ids dropped),
+    instead of on every unlock check.
+    """
+    entries = getattr(config, "_hero_unlock_entries_cache", None)
+    if entries is None:
+        defs_by_id: Dict[str, HeroDef] = {}
+        for h in config.heroes:
+            defs_by_id.setdefault(h.hero_id, h)
+        entries = [
+            (int(threshold), [defs_by_id[hid] for hid in hero_ids if hid in defs_by_id])
+            for threshold, hero_ids in config.hero_unlock_schedule.items()
+        ]
+        object.__setattr__(config, "_hero_unlock_entries_cache", entries)
+    return entries
+
+
 def unlock_heroes_by_day(
     game_state: HeroCardGameState, config: HeroCardConfig
 ) -> List[str]:
@@ -30,15 +50,13 @@ def unlock_heroes_by_day(
     """
     unlocked: List[str] = []
     current_day = game_state.day
-    for threshold, hero_ids in config.hero_unlock_schedule.items():
-        if int(threshold) <= current_day:
-            for hero_id in hero_ids:
-                if hero_id not in game_state.heroes:
-                    hero_def = next((h for h in config.heroes if h.hero_id == hero_id), None)
-                    if hero_def:
-                        game_state.heroes[hero_id] = initialize_hero(hero_def)
-                        game_state.last_unlocked_hero = hero_id
-                        unlocked.append(hero_def.name)
+    for threshold, hero_defs in _hero_unlock_entries(config):
+        if threshold <= current_day:
+            for hero_def in hero_defs:
+                if hero_def.hero_id not in game_state.heroes:
+                    game_state.heroes[hero_def.hero_id] = initialize_hero(hero_def)
+                    game_state.last_unlocked_hero = hero_def.hero_id
+                    unlocked.append(hero_def.name)
     return unlocked
 
 
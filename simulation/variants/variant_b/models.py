@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
+from simulation.models import CardCategory
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -23,6 +25,21 @@ class HeroCardRarity(str, Enum):
     GOLD = "GOLD"
 
 
+# Plain-string value of every rarity / category member. `Enum.value` is a
+# descriptor call; a dict hit is several times cheaper on per-pull paths.
+_ENUM_VALUES: Dict[Any, str] = {
+    member: member.value for enum_cls in (HeroCardRarity, CardCategory) for member in enum_cls
+}
+
+
+def enum_value(member: Any) -> str:
+    """String value of a rarity/category, tolerant of enum or raw value."""
+    value = _ENUM_VALUES.get(member)
+    if value is None:
+        value = member.value if isinstance(member, Enum) else str(member)
+    return value
+
+
 # ---------------------------------------------------------------------------
 # Shared card models (Gold/Blue/Gray — separate from hero cards)
 # ---------------------------------------------------------------------------
@@ -341,6 +358,10 @@ class HeroCardConfig(BaseModel):
     # have unlocked — decoupled from how many tokens they actually earn.
     unlimited_hero_tokens: bool = Field(default=False, description="Skip the HeroToken cost gate on skill-tree nodes (demand analysis)")
 
+    # When False the run keeps no per-pull log (`pull_logs` comes back empty).
+    # Bulk runs that only read snapshots — Monte Carlo, sweeps — turn it off.
+    log_pulls: bool = Field(default=True, description="Record every pull in SimResult.pull_logs")
+
     # Drop algorithm
     drop_config: HeroDropConfig = Field(default_factory=HeroDropConfig)
 
@@ -416,6 +437,18 @@ class HeroCardConfig(BaseModel):
     )
 
 
+def clear_derived_caches(config: HeroCardConfig) -> None:
+    """Drop the `_*_cache` lookups the engine memoizes on a config.
+
+    The editor mutates configs in place (tables, names, pack types), which the
+    memoized lookups can't see. `run_simulation` calls this on entry and the
+    editor after each render, so every run starts from the current values.
+    """
+    for obj in (config, *config.pack_types):
+        for name in [n for n in vars(obj) if n.startswith("_") and n.endswith("_cache")]:
+            del obj.__dict__[name]
+
+
 # ---------------------------------------------------------------------------
 # Runtime state models
 # ---------------------------------------------------------------------------
@@ -515,12 +548,13 @@ class HeroCardGameState(BaseModel):
 # Simulation result models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class HeroDailySnapshot:
     """Per-hero end-of-day state snapshot.
 
     Pydantic is overkill here — these are pure value carriers built once per
-    hero per day. Stored inside `HeroCardDailySnapshot.hero_states`.
+    hero per day. Stored inside `HeroCardDailySnapshot.hero_states`. Slotted
+    because a 365-day run holds one per hero per day.
     """
     level: int = 0
     xp: int = 0
@@ -536,7 +570,7 @@ class HeroDailySnapshot:
     gear_total_level: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HeroCardDailySnapshot:
     """Daily snapshot for Variant B. Satisfies DailySnapshotProtocol + extra fields."""
     # Protocol fields
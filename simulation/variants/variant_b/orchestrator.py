@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_right
 from random import Random
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from simulation.models import Card, CardCategory
 
 from simulation.variants.variant_b.models import (
@@ -12,11 +16,13 @@ from simulation.variants.variant_b.models import (
     HeroCardDailySnapshot,
     HeroCardGameState,
     HeroDailySnapshot,
+    HeroPackType,
     HeroSimResult,
+    clear_derived_caches,
+    enum_value,
 )
 from simulation.variants.variant_b.hero_deck import (
     get_unlocked_cards,
-    hero_card_avg_level,
     initialize_hero,
     unlock_heroes_by_day,
 )
@@ -24,9 +30,9 @@ from simulation.variants.variant_b.drop_algorithm import (
     check_joker_drop,
     compute_hero_duplicates,
     compute_shared_duplicates,
-    decide_hero_or_shared,
     get_coins_per_dupe,
     get_shared_coins_per_dupe,
+    make_hero_or_shared_decider,
     select_hero_card,
     select_shared_card,
 )
@@ -52,17 +58,34 @@ from simulation.variants.variant_b.chapter_schedule import (
     chapters_for_bluestars,
     chapters_for_sim_day,
 )
-from simulation.pull_logger import PullLogger, VariantBUpgradeEvent
+from simulation.pull_logger import NullPullLogger, PullLogger, VariantBUpgradeEvent
 
 
 def _resolve_card_name(config: HeroCardConfig, hero_id: str, card_id: str) -> str:
-    """Look up card name from config hero definitions."""
-    for hero_def in config.heroes:
-        if hero_def.hero_id == hero_id:
+    """Look up card name from config hero definitions (memoized on the config)."""
+    cache = getattr(config, "_card_name_cache", None)
+    if cache is None:
+        cache = {}
+        for hero_def in config.heroes:
             for card_def in hero_def.card_pool:
-                if card_def.card_id == card_id:
-                    return card_def.name
-    return card_id
+                cache.setdefault((hero_def.hero_id, card_def.card_id), card_def.name)
+        object.__setattr__(config, "_card_name_cache", cache)
+    return cache.get((hero_id, card_id), card_id)
+
+
+_hero_category_labels: Dict[str, str] = {}
+
+
+def _hero_category(hero_id: str) -> str:
+    """Interned ``HERO_<hero_id>`` pull/snapshot category label.
+
+    Every hero pull logs this label; interning keeps one shared string per
+    hero instead of a fresh one per logged pull.
+    """
+    label = _hero_category_labels.get(hero_id)
+    if label is None:
+        label = _hero_category_labels[hero_id] = sys.intern(f"HERO_{hero_id}")
+    return label
 
 
 def run_simulation(
@@ -70,6 +93,9 @@ def run_simulation(
     rng: Optional[Random] = None,
 ) -> HeroSimResult:
     """Run a full Variant B simulation."""
+    # Lookups memoized on the config are rebuilt per run, since the editor
+    # may have changed the values behind them since the last one.
+    clear_derived_caches(config)
     game_state = _create_initial_state(config)
     game_state.coins = config.initial_coins
 
@@ -90,9 +116,16 @@ def run_simulation(
     unlock_heroes_by_day(game_state, config)
 
     snapshots: List[HeroCardDailySnapshot] = []
-    pull_logger = PullLogger()
+    pull_logger = PullLogger() if config.log_pulls else NullPullLogger()
     total_coins_earned = 0
     total_coins_spent = 0
+    # Lifetime totals, accumulated as each day closes rather than re-summed
+    # over every snapshot at the end of the run.
+    lifetime_hero_xp = 0
+    total_premium_diamonds = 0
+    total_jokers_received = 0
+    total_hero_tokens = 0
+    total_hero_tokens_spent = 0
     all_upgrade_events: Dict[str, int] = {}
 
     # Hero Token *demand* lookup: hero_id -> [(hero_level_required, token_cost), ...].
@@ -110,6 +143,33 @@ def run_simulation(
     demand_frontier: Dict[str, int] = {}
     total_hero_token_demand = 0
 
+    # The shared deck is fixed for the whole run, so category membership is
+    # resolved once into boolean masks; the daily snapshot then takes masked
+    # means over a single levels array instead of three list filters.
+    shared_cards = game_state.shared_cards
+    shared_category_masks: Dict[str, np.ndarray] = {}
+    for category in (CardCategory.GOLD_SHARED, CardCategory.BLUE_SHARED, CardCategory.GRAY_SHARED):
+        mask = np.fromiter(
+            (getattr(c, "category", None) == category for c in shared_cards),
+            dtype=bool, count=len(shared_cards),
+        )
+        if mask.any():
+            shared_category_masks[category.value] = mask
+
+    # Checked once per run so the twice-daily chapter lookups can bisect.
+    chapter_thresholds = config.chapter_bluestar_thresholds
+    chapter_thresholds_ascending = all(
+        a <= b for a, b in zip(chapter_thresholds, chapter_thresholds[1:])
+    )
+
+    # Hero unlocks only change state on the days a schedule threshold is
+    # reached (thresholds <= 1 all land on day 1), so the schedule walk is
+    # skipped on every other day.
+    hero_unlock_days = {max(int(threshold), 1) for threshold in config.hero_unlock_schedule}
+
+    # Hero-vs-shared roll specialized to this run's base rate and RNG mode.
+    decide_hero_or_shared = make_hero_or_shared_decider(config, rng)
+
     for day in range(1, config.num_days + 1):
         game_state.day = day
         day_bluestars_start = game_state.total_bluestars
@@ -129,7 +189,8 @@ def run_simulation(
         pull_index = 0
 
         # 1. Check hero unlock schedule
-        _process_hero_unlocks(day, config, game_state)
+        if day in hero_unlock_days:
+            _process_hero_unlocks(day, config, game_state)
 
         # 2. Process regular pack pulls
         num_pulls, day_pack_counts, per_pack_pulls = _get_daily_pulls(day, config, game_state, rng)
@@ -152,7 +213,7 @@ def run_simulation(
             shared_boost, unique_boost = get_dupe_boost(pack_name, config)
 
             for _ in range(cards_in_pack):
-                pull_type = decide_hero_or_shared(game_state, config, rng, pull_index=pull_index)
+                pull_type = decide_hero_or_shared(day, pull_index)
 
                 if pull_type == "hero":
                     result = select_hero_card(game_state, config, rng)
@@ -181,14 +242,13 @@ def run_simulation(
                                 pull_index=pull_index,
                                 card_id=card_id,
                                 card_name=_resolve_card_name(config, hero_id, card_id),
-                                card_category=f"HERO_{hero_id}",
+                                card_category=_hero_category(hero_id),
                                 card_level_before=level_before,
                                 duplicates_received=dupes,
                                 duplicates_total_after=card.duplicates,
                                 coins_earned=coin_income,
                                 pack_name=pack_name,
                                 bluestars_earned=0,
-                                upgrades=[],
                             )
 
                     # Check joker drop
@@ -203,7 +263,7 @@ def run_simulation(
                     if card:
                         level_before = card.level
                         # Per-category duplicate computation (same formula as hero cards)
-                        cat = card.category.value if hasattr(card.category, "value") else str(card.category)
+                        cat = enum_value(card.category)
                         dupes = compute_shared_duplicates(card.level, cat, config, rng, boost=shared_boost)
                         card.duplicates += dupes
                         day_pull_counts[cat] = day_pull_counts.get(cat, 0) + 1
@@ -228,7 +288,6 @@ def run_simulation(
                             coins_earned=coin_income,
                             pack_name=pack_name,
                             bluestars_earned=0,
-                            upgrades=[],
                         )
 
             # Roll bonus items for this pack opening and credit to game_state.
@@ -276,14 +335,13 @@ def run_simulation(
                         pull_index=pull_index,
                         card_id="__joker__",
                         card_name="Hero Joker",
-                        card_category=f"HERO_{hero_id}",
+                        card_category=_hero_category(hero_id),
                         card_level_before=0,
                         duplicates_received=1,
                         duplicates_total_after=1,
                         coins_earned=0,
                         pack_name="premium",
                         bluestars_earned=0,
-                        upgrades=[],
                     )
             else:
                 hero_id = pull["hero_id"]
@@ -300,14 +358,13 @@ def run_simulation(
                             pull_index=pull_index,
                             card_id=card_id,
                             card_name=_resolve_card_name(config, hero_id, card_id),
-                            card_category=f"HERO_{hero_id}",
+                            card_category=_hero_category(hero_id),
                             card_level_before=level_before,
                             duplicates_received=pull["duplicates"],
                             duplicates_total_after=card_obj.duplicates,
                             coins_earned=0,
                             pack_name="premium",
                             bluestars_earned=0,
-                            upgrades=[],
                         )
 
         # 3b. Beat chapters. Big-simulator rule: chapter N is beaten when
@@ -325,6 +382,7 @@ def run_simulation(
                 config.chapter_bluestar_thresholds,
                 game_state.total_bluestars,
                 game_state.chapters_beaten,
+                ascending=chapter_thresholds_ascending,
             )
         else:
             chapters_today = chapters_for_sim_day(config.chapters_per_day, day)
@@ -391,6 +449,7 @@ def run_simulation(
                 config.chapter_bluestar_thresholds,
                 game_state.total_bluestars,
                 game_state.chapters_beaten,
+                ascending=chapter_thresholds_ascending,
             )
             if extra_chapters:
                 chapter_rng = rng if rng is not None else Random(day * 31 + 1)
@@ -434,47 +493,78 @@ def run_simulation(
             last_pull.upgrades = converted_upgrades
             last_pull.bluestars_earned = sum(u.bluestars_earned for u in converted_upgrades)
 
+        day_hero_xp_total = sum(day_hero_xp.values())
+        tokens_balance_end = int(game_state.bonus_items.get("HeroTokens", 0))
+        day_tokens_spent = max(0, tokens_balance_start + day_hero_tokens - tokens_balance_end)
+
         total_coins_earned += day_coins_earned
         total_coins_spent += day_coins_spent
+        lifetime_hero_xp += day_hero_xp_total
+        total_premium_diamonds += day_premium_diamonds
+        total_jokers_received += day_jokers_received
+        total_hero_tokens += day_hero_tokens
+        total_hero_tokens_spent += day_tokens_spent
 
         # 5. Record daily snapshot
         category_avg_levels: Dict[str, float] = {}
-        gold_cards = [c for c in game_state.shared_cards if getattr(c, "category", None) == CardCategory.GOLD_SHARED]
-        blue_cards = [c for c in game_state.shared_cards if getattr(c, "category", None) == CardCategory.BLUE_SHARED]
-        gray_cards = [c for c in game_state.shared_cards if getattr(c, "category", None) == CardCategory.GRAY_SHARED]
-        if gold_cards:
-            category_avg_levels["GOLD_SHARED"] = sum(c.level for c in gold_cards) / len(gold_cards)
-        if blue_cards:
-            category_avg_levels["BLUE_SHARED"] = sum(c.level for c in blue_cards) / len(blue_cards)
-        if gray_cards:
-            category_avg_levels["GRAY_SHARED"] = sum(c.level for c in gray_cards) / len(gray_cards)
-
-        hero_avg_levels = {hid: hero_card_avg_level(hs) for hid, hs in game_state.heroes.items()}
-        for hero_id, avg in hero_avg_levels.items():
-            category_avg_levels[f"HERO_{hero_id}"] = avg
+        shared_levels = np.fromiter(
+            (c.level for c in shared_cards), dtype=np.int64, count=len(shared_cards),
+        )
+        for category_key, mask in shared_category_masks.items():
+            category_avg_levels[category_key] = float(shared_levels[mask].mean())
 
         # Per-hero end-of-day snapshot. Total cards = sum of duplicates across
         # the hero's deck (an "ever-pulled" count would also be sensible — we
         # use dupes because that's what drives upgrades and is comparable to
         # joker_count as a resource).
+        #
+        # Heroes whose state didn't move since yesterday reuse yesterday's
+        # HeroDailySnapshot object (and unchanged gear dicts are shared), so a
+        # long run doesn't retain one fresh copy per hero per day. Snapshots
+        # are read-only once recorded.
+        #
+        # One pass per hero deck feeds the rarity counts, the unlocked-card
+        # average level (same result as `hero_card_avg_level`) and the hero
+        # level maps, instead of re-walking game_state.heroes for each.
+        prev_hero_states = snapshots[-1].hero_states if snapshots else {}
         hero_states_today: Dict[str, HeroDailySnapshot] = {}
+        hero_avg_levels: Dict[str, float] = {}
+        hero_levels: Dict[str, int] = {}
+        shared_hero_level = 1
         for hid, hs in game_state.heroes.items():
             cards_by_rarity: Dict[str, int] = {}
             total_cards = 0
+            unlocked_level_sum = 0
+            unlocked_count = 0
             for card in hs.cards.values():
-                rarity_key = card.rarity.value if hasattr(card.rarity, "value") else str(card.rarity)
+                rarity_key = enum_value(card.rarity)
                 cards_by_rarity[rarity_key] = cards_by_rarity.get(rarity_key, 0) + card.duplicates
                 total_cards += card.duplicates
-            hero_states_today[hid] = HeroDailySnapshot(
+                if card.unlocked:
+                    unlocked_level_sum += card.level
+                    unlocked_count += 1
+            avg_level = unlocked_level_sum / unlocked_count if unlocked_count else 0.0
+            hero_avg_levels[hid] = avg_level
+            category_avg_levels[_hero_category(hid)] = avg_level
+            hero_levels[hid] = hs.level
+            if len(hero_levels) == 1 or hs.level > shared_hero_level:
+                shared_hero_level = hs.level
+            prev = prev_hero_states.get(hid)
+            if prev is not None and prev.gear_levels == hs.gear.slot_levels:
+                gear_levels = prev.gear_levels
+            else:
+                gear_levels = dict(hs.gear.slot_levels)
+            hero_snapshot = HeroDailySnapshot(
                 level=hs.level,
                 xp=hs.xp,
                 joker_count=hs.joker_count,
                 cards_by_rarity=cards_by_rarity,
                 total_cards=total_cards,
                 pet_level=hs.pet.level,
-                gear_levels=dict(hs.gear.slot_levels),
+                gear_levels=gear_levels,
                 gear_total_level=gear_total_level(hs.gear),
             )
+            hero_states_today[hid] = prev if hero_snapshot == prev else hero_snapshot
 
         snapshot = HeroCardDailySnapshot(
             day=day,
@@ -486,10 +576,10 @@ def run_simulation(
             category_avg_levels=category_avg_levels,
             pull_counts_by_type=day_pull_counts,
             pack_counts_by_type=day_pack_counts,
-            shared_hero_level=max((hs.level for hs in game_state.heroes.values()), default=1),
-            shared_hero_xp_today=sum(day_hero_xp.values()),
+            shared_hero_level=shared_hero_level,
+            shared_hero_xp_today=day_hero_xp_total,
             hero_xp_today=day_hero_xp,
-            hero_levels={hid: hs.level for hid, hs in game_state.heroes.items()},
+            hero_levels=hero_levels,
             hero_card_avg_levels=hero_avg_levels,
             skill_nodes_unlocked_today=day_skill_nodes,
             cards_unlocked_today=day_cards_unlocked,
@@ -499,12 +589,8 @@ def run_simulation(
             premium_diamonds_spent=day_premium_diamonds,
             premium_bluestars_today=day_premium_bluestars,
             hero_tokens_received=day_hero_tokens,
-            hero_tokens_balance=int(game_state.bonus_items.get("HeroTokens", 0)),
-            hero_tokens_spent_today=max(
-                0,
-                tokens_balance_start + day_hero_tokens
-                - int(game_state.bonus_items.get("HeroTokens", 0)),
-            ),
+            hero_tokens_balance=tokens_balance_end,
+            hero_tokens_spent_today=day_tokens_spent,
             hero_token_demand_today=day_token_demand,
             hero_token_demand_by_hero=day_token_demand_by_hero,
             chapters_beaten_today=chapters_today,
@@ -517,8 +603,6 @@ def run_simulation(
     # `final_shared_hero_xp` reports CUMULATIVE XP earned across the run, not the
     # current remaining XP toward next level — otherwise dashboards would see this
     # number drop every time a hero levels up.
-    lifetime_hero_xp = sum(s.shared_hero_xp_today for s in snapshots)
-
     return HeroSimResult(
         daily_snapshots=snapshots,
         total_bluestars=game_state.total_bluestars,
@@ -530,10 +614,10 @@ def run_simulation(
         final_shared_hero_xp=lifetime_hero_xp,
         final_hero_levels={hid: hs.level for hid, hs in game_state.heroes.items()},
         final_hero_xp={hid: hs.xp for hid, hs in game_state.heroes.items()},
-        total_premium_diamonds_spent=sum(s.premium_diamonds_spent for s in snapshots),
-        total_jokers_received=sum(s.jokers_received_today for s in snapshots),
-        total_hero_tokens=sum(s.hero_tokens_received for s in snapshots),
-        total_hero_tokens_spent=sum(s.hero_tokens_spent_today for s in snapshots),
+        total_premium_diamonds_spent=total_premium_diamonds,
+        total_jokers_received=total_jokers_received,
+        total_hero_tokens=total_hero_tokens,
+        total_hero_tokens_spent=total_hero_tokens_spent,
         total_hero_token_demand=total_hero_token_demand,
         final_hero_tokens_balance=int(game_state.bonus_items.get("HeroTokens", 0)),
         final_hero_skill_progress={
@@ -555,15 +639,15 @@ def _create_initial_state(config: HeroCardConfig) -> HeroCardGameState:
     # Initialize shared cards (Gold + Blue + Gray)
     for i in range(1, config.num_gold_cards + 1):
         state.shared_cards.append(
-            Card(id=f"gold_{i}", name=f"Gold Card {i}", category=CardCategory.GOLD_SHARED)
+            Card(id=sys.intern(f"gold_{i}"), name=f"Gold Card {i}", category=CardCategory.GOLD_SHARED)
         )
     for i in range(1, config.num_blue_cards + 1):
         state.shared_cards.append(
-            Card(id=f"blue_{i}", name=f"Blue Card {i}", category=CardCategory.BLUE_SHARED)
+            Card(id=sys.intern(f"blue_{i}"), name=f"Blue Card {i}", category=CardCategory.BLUE_SHARED)
         )
     for i in range(1, config.num_gray_cards + 1):
         state.shared_cards.append(
-            Card(id=f"gray_{i}", name=f"Gray Card {i}", category=CardCategory.GRAY_SHARED)
+            Card(id=sys.intern(f"gray_{i}"), name=f"Gray Card {i}", category=CardCategory.GRAY_SHARED)
         )
 
     # Initialize heroes from day 0 unlock schedule
@@ -592,23 +676,50 @@ def _process_hero_unlocks(
     unlock_heroes_by_day(game_state, config)
 
 
+def _card_types_floor_table(
+    pack_type: HeroPackType,
+) -> tuple[List[int], List[tuple[int, int]]]:
+    """Ascending card_types_table thresholds and their (min, max) ranges.
+
+    Memoized on the pack type so the daily floor match is a bisect instead of
+    a scan over every threshold.
+    """
+    table = getattr(pack_type, "_card_types_floor_cache", None)
+    if table is None:
+        ranges_by_threshold: Dict[int, tuple[int, int]] = {}
+        for key, entry in pack_type.card_types_table.items():
+            if hasattr(entry, "min"):
+                card_range = (entry.min, entry.max)
+            else:
+                card_range = (int(entry.get("min", 1)), int(entry.get("max", 3)))
+            ranges_by_threshold.setdefault(int(key), card_range)
+        thresholds = sorted(ranges_by_threshold)
+        table = (thresholds, [ranges_by_threshold[t] for t in thresholds])
+        object.__setattr__(pack_type, "_card_types_floor_cache", table)
+    return table
+
+
 def _get_card_types_for_count(
-    card_types_table: Dict[int, Any],
+    pack_type: HeroPackType,
     total_unlocked: int,
 ) -> tuple[int, int]:
     """Floor-match total unlocked count against card_types_table thresholds.
 
-    Returns (min, max) card types for the matching threshold.
+    Returns (min, max) card types for the matching threshold (the lowest
+    threshold when total_unlocked is below all of them).
     """
-    matching_keys = [k for k in card_types_table if int(k) <= total_unlocked]
-    if not matching_keys:
-        best_key = min(card_types_table.keys(), key=lambda k: int(k))
-    else:
-        best_key = max(matching_keys, key=lambda k: int(k))
-    entry = card_types_table[best_key]
-    if hasattr(entry, "min"):
-        return entry.min, entry.max
-    return int(entry.get("min", 1)), int(entry.get("max", 3))
+    thresholds, ranges = _card_types_floor_table(pack_type)
+    idx = bisect_right(thresholds, total_unlocked) - 1
+    return ranges[max(idx, 0)]
+
+
+def _get_pack_type_map(config: HeroCardConfig) -> Dict[str, HeroPackType]:
+    """Pack type lookup by name (memoized on the config)."""
+    pack_type_map = getattr(config, "_pack_type_map_cache", None)
+    if pack_type_map is None:
+        pack_type_map = {pt.name: pt for pt in config.pack_types}
+        object.__setattr__(config, "_pack_type_map_cache", pack_type_map)
+    return pack_type_map
 
 
 def _get_daily_pulls(
@@ -631,11 +742,7 @@ def _get_daily_pulls(
     idx = (day - 1) % len(config.daily_pack_schedule)
     day_schedule = config.daily_pack_schedule[idx]
 
-    # Build pack type lookup by name
-    from simulation.variants.variant_b.models import HeroPackType
-    pack_type_map: Dict[str, HeroPackType] = {}
-    for pt in config.pack_types:
-        pack_type_map[pt.name] = pt
+    pack_type_map = _get_pack_type_map(config)
 
     # Count total unlocked cards across all heroes
     total_unlocked = 0
@@ -674,7 +781,7 @@ def _get_daily_pulls(
         # Determine cards per pack from card_types_table
         pt = pack_type_map.get(pack_name)
         if pt and pt.card_types_table:
-            min_cards, max_cards = _get_card_types_for_count(pt.card_types_table, total_unlocked)
+            min_cards, max_cards = _get_card_types_for_count(pt, total_unlocked)
         else:
             min_cards, max_cards = 1, 3
 
@@ -6,6 +6,7 @@ hero leveling (XP thresholds), and skill tree advancement.
 
 from __future__ import annotations
 
+import heapq
 from typing import Any, Dict, List, Optional, Tuple
 
 from simulation.variants.variant_b.models import (
@@ -16,6 +17,7 @@ from simulation.variants.variant_b.models import (
     HeroProgressState,
     HeroUpgradeCostTable,
     SharedUpgradeCostTable,
+    enum_value,
 )
 from simulation.variants.variant_b.hero_deck import get_unlocked_cards
 from simulation.variants.variant_b.hero_joker import consume_joker, jokers_available
@@ -25,19 +27,69 @@ from simulation.variants.variant_b.skill_tree import check_and_advance_skill_tre
 def _get_upgrade_table(
     config: HeroCardConfig, rarity_value: str
 ) -> Optional[HeroUpgradeCostTable]:
-    """Find the upgrade cost table for a given rarity."""
-    for table in config.hero_upgrade_tables:
-        if table.rarity.value == rarity_value:
-            return table
-    return None
+    """Find the upgrade cost table for a given rarity.
+
+    Memoized on the config (first table per rarity wins, as with a linear
+    scan) — the greedy upgrade loop calls this for every candidate card.
+    """
+    cache = getattr(config, "_upgrade_table_by_rarity_cache", None)
+    if cache is None:
+        cache = {}
+        for table in config.hero_upgrade_tables:
+            cache.setdefault(table.rarity.value, table)
+        object.__setattr__(config, "_upgrade_table_by_rarity_cache", cache)
+    return cache.get(rarity_value)
+
+
+def _get_upgrade_steps(
+    config: HeroCardConfig, rarity_value: str
+) -> Optional[Tuple[Tuple[int, int, int, int], ...]]:
+    """Per-level (dupe_cost, coin_cost, bluestar_reward, xp_reward) for a rarity.
+
+    Built once per config from the rarity's upgrade table, so an upgrade
+    attempt is one tuple index instead of four list lookups with bounds
+    checks. Levels past either cost list are absent (can't upgrade); missing
+    rewards count as 0. None when the rarity has no table.
+    """
+    cache = getattr(config, "_hero_upgrade_steps_cache", None)
+    if cache is None:
+        cache = {}
+        object.__setattr__(config, "_hero_upgrade_steps_cache", cache)
+    if rarity_value not in cache:
+        table = _get_upgrade_table(config, rarity_value)
+        cache[rarity_value] = None if table is None else _build_upgrade_steps(
+            table.duplicate_costs, table.coin_costs, table.bluestar_rewards, table.xp_rewards,
+        )
+    return cache[rarity_value]
+
+
+def _build_upgrade_steps(
+    duplicate_costs: List[int],
+    coin_costs: List[int],
+    bluestar_rewards: List[int],
+    xp_rewards: List[int],
+) -> Tuple[Tuple[int, int, int, int], ...]:
+    num_levels = min(len(duplicate_costs), len(coin_costs))
+    return tuple(
+        (
+            duplicate_costs[i],
+            coin_costs[i],
+            bluestar_rewards[i] if i < len(bluestar_rewards) else 0,
+            xp_rewards[i] if i < len(xp_rewards) else 0,
+        )
+        for i in range(num_levels)
+    )
 
 
 def _get_hero_def(config: HeroCardConfig, hero_id: str) -> Optional[HeroDef]:
-    """Find a hero definition by ID."""
-    for h in config.heroes:
-        if h.hero_id == hero_id:
-            return h
-    return None
+    """Find a hero definition by ID (memoized on the config)."""
+    cache = getattr(config, "_hero_def_cache", None)
+    if cache is None:
+        cache = {}
+        for h in config.heroes:
+            cache.setdefault(h.hero_id, h)
+        object.__setattr__(config, "_hero_def_cache", cache)
+    return cache.get(hero_id)
 
 
 def try_upgrade_hero_card(
@@ -64,18 +116,15 @@ def try_upgrade_hero_card(
     hero_def = _get_hero_def(config, hero_id)
     if not hero_def:
         return None
-    table = _get_upgrade_table(config, card.rarity.value)
-    if not table:
+    steps = _get_upgrade_steps(config, enum_value(card.rarity))
+    if not steps:
         return None
 
     level_idx = card.level - 1
-    if level_idx >= len(table.duplicate_costs) or level_idx >= len(table.coin_costs):
+    if level_idx >= len(steps):
         return None
 
-    dupe_cost = table.duplicate_costs[level_idx]
-    coin_cost = table.coin_costs[level_idx]
-    bluestar_reward = table.bluestar_rewards[level_idx] if level_idx < len(table.bluestar_rewards) else 0
-    xp_reward = table.xp_rewards[level_idx] if level_idx < len(table.xp_rewards) else 0
+    dupe_cost, coin_cost, bluestar_reward, xp_reward = steps[level_idx]
 
     available_dupes = card.duplicates
     joker_available = jokers_available(hero_state)
@@ -111,7 +160,7 @@ def try_upgrade_hero_card(
     event = {
         "hero_id": hero_id,
         "card_id": card.card_id,
-        "rarity": card.rarity.value if hasattr(card.rarity, "value") else str(card.rarity),
+        "rarity": enum_value(card.rarity),
         "old_level": old_level,
         "new_level": card.level,
         "dupes_spent": dupes_from_card,
@@ -142,29 +191,46 @@ def attempt_hero_upgrades(
     total_bluestars = 0
     tree_activations: Dict[str, List] = {}
 
-    made_progress = True
-    while made_progress:
-        made_progress = False
-
-        candidates: List[Tuple[str, HeroCardState]] = []
-        for hero_id, hero_state in game_state.heroes.items():
-            for card in get_unlocked_cards(hero_state):
-                candidates.append((hero_id, card))
-
-        candidates.sort(key=lambda x: x[1].level)
-
-        for hero_id, card in candidates:
-            result = try_upgrade_hero_card(game_state, config, hero_id, card.card_id)
-            if result is None:
-                continue
-            event, tree_acts = result
-            events.append(event)
-            total_xp += event["xp_earned"]
-            total_bluestars += event["bluestars_earned"]
-            if tree_acts:
-                tree_activations.setdefault(hero_id, []).extend(tree_acts)
-            made_progress = True
-            break  # Restart scan from lowest level
+    # Min-heap on (level, hero position, card position): the same lowest-level
+    # first, deck-order tie-break as rescanning a sorted candidate list after
+    # every upgrade, without the restarts. A card that can't upgrade is dropped
+    # for good — an upgrade only touches its own card and spends the hero's
+    # jokers, so nothing here can make another card affordable again. Cards a
+    # skill-tree activation unlocks are pushed as they come online.
+    hero_positions = {hero_id: pos for pos, hero_id in enumerate(game_state.heroes)}
+    card_positions: Dict[str, Dict[str, int]] = {}
+    heap: List[Tuple[int, int, int, str, HeroCardState]] = []
+    queued = set()
+    for hero_id, hero_state in game_state.heroes.items():
+        positions = {card_id: pos for pos, card_id in enumerate(hero_state.cards)}
+        card_positions[hero_id] = positions
+        for card in get_unlocked_cards(hero_state):
+            heap.append((card.level, hero_positions[hero_id], positions[card.card_id], hero_id, card))
+            queued.add((hero_id, card.card_id))
+    heapq.heapify(heap)
+
+    while heap:
+        _, hero_pos, card_pos, hero_id, card = heapq.heappop(heap)
+        result = try_upgrade_hero_card(game_state, config, hero_id, card.card_id)
+        if result is None:
+            continue
+        event, tree_acts = result
+        events.append(event)
+        total_xp += event["xp_earned"]
+        total_bluestars += event["bluestars_earned"]
+        heapq.heappush(heap, (card.level, hero_pos, card_pos, hero_id, card))
+        if tree_acts:
+            tree_activations.setdefault(hero_id, []).extend(tree_acts)
+            hero_state = game_state.heroes[hero_id]
+            for _, card_ids, _ in tree_acts:
+                for card_id in card_ids:
+                    unlocked = hero_state.cards.get(card_id)
+                    if unlocked is None or not unlocked.unlocked or (hero_id, card_id) in queued:
+                        continue
+                    heapq.heappush(heap, (
+                        unlocked.level, hero_pos, card_positions[hero_id][card_id], hero_id, unlocked,
+                    ))
+                    queued.add((hero_id, card_id))
 
     return events, total_xp, total_bluestars, tree_activations
 
@@ -196,10 +262,29 @@ def _check_hero_level_up(
 def _get_shared_upgrade_table(
     config: HeroCardConfig, category: str
 ) -> Optional[SharedUpgradeCostTable]:
-    for t in config.shared_upgrade_tables:
-        if t.category == category:
-            return t
-    return None
+    cache = getattr(config, "_shared_upgrade_table_by_category_cache", None)
+    if cache is None:
+        cache = {}
+        for t in config.shared_upgrade_tables:
+            cache.setdefault(t.category, t)
+        object.__setattr__(config, "_shared_upgrade_table_by_category_cache", cache)
+    return cache.get(category)
+
+
+def _get_shared_upgrade_steps(
+    config: HeroCardConfig, category: str
+) -> Optional[Tuple[Tuple[int, int, int, int], ...]]:
+    """Per-level upgrade steps for a shared category (xp slot always 0)."""
+    cache = getattr(config, "_shared_upgrade_steps_cache", None)
+    if cache is None:
+        cache = {}
+        object.__setattr__(config, "_shared_upgrade_steps_cache", cache)
+    if category not in cache:
+        table = _get_shared_upgrade_table(config, category)
+        cache[category] = None if table is None else _build_upgrade_steps(
+            table.duplicate_costs, table.coin_costs, table.bluestar_rewards, [],
+        )
+    return cache[category]
 
 
 def try_upgrade_shared_card(
@@ -216,19 +301,26 @@ def try_upgrade_shared_card(
             break
     if card is None:
         return None
+    return _upgrade_shared_card(game_state, config, card, card_id)
+
 
-    category_value = card.category.value if hasattr(card.category, "value") else str(card.category)
-    table = _get_shared_upgrade_table(config, category_value)
-    if not table:
+def _upgrade_shared_card(
+    game_state: HeroCardGameState,
+    config: HeroCardConfig,
+    card: Any,
+    card_id: str,
+) -> Optional[Dict[str, Any]]:
+    """Upgrade an already-resolved shared card (skips the id lookup)."""
+    category_value = enum_value(card.category)
+    steps = _get_shared_upgrade_steps(config, category_value)
+    if not steps:
         return None
 
     level_idx = card.level - 1
-    if level_idx >= len(table.duplicate_costs) or level_idx >= len(table.coin_costs):
+    if level_idx >= len(steps):
         return None
 
-    dupe_cost = table.duplicate_costs[level_idx]
-    coin_cost = table.coin_costs[level_idx]
-    bluestar_reward = table.bluestar_rewards[level_idx] if level_idx < len(table.bluestar_rewards) else 0
+    dupe_cost, coin_cost, bluestar_reward, _ = steps[level_idx]
 
     if card.duplicates < dupe_cost:
         return None
@@ -265,21 +357,21 @@ def attempt_shared_upgrades(
     events: List[Dict[str, Any]] = []
     total_bluestars = 0
 
-    made_progress = True
-    while made_progress:
-        made_progress = False
-
-        candidates = sorted(game_state.shared_cards, key=lambda c: c.level)
-        for card in candidates:
-            cid = getattr(card, "id", None) or getattr(card, "card_id", None)
-            if cid is None:
-                continue
-            event = try_upgrade_shared_card(game_state, config, cid)
-            if event is None:
-                continue
-            events.append(event)
-            total_bluestars += event["bluestars_earned"]
-            made_progress = True
-            break  # Restart scan from lowest level
+    # Min-heap on (level, list position) — same order as re-sorting after
+    # every upgrade. Shared upgrades only change the upgraded card, so a card
+    # that can't upgrade now can't later in this call and is dropped.
+    heap = [(card.level, pos, card) for pos, card in enumerate(game_state.shared_cards)]
+    heapq.heapify(heap)
+    while heap:
+        _, pos, card = heapq.heappop(heap)
+        cid = getattr(card, "id", None) or getattr(card, "card_id", None)
+        if cid is None:
+            continue
+        event = _upgrade_shared_card(game_state, config, card, cid)
+        if event is None:
+            continue
+        events.append(event)
+        total_bluestars += event["bluestars_earned"]
+        heapq.heappush(heap, (card.level, pos, card))
 
     return events, total_bluestars
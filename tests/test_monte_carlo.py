@@ -0,0 +1,60 @@
+"""Tests for the Monte Carlo driver (simulation/monte_carlo.py)."""
+
+from __future__ import annotations
+
+from random import Random
+
+import pytest
+
+from simulation.monte_carlo import run_monte_carlo
+from simulation.variants.variant_b.config_loader import load_defaults
+from simulation.variants.variant_b.orchestrator import run_simulation
+
+
+@pytest.fixture
+def short_config():
+    config = load_defaults()
+    config.num_days = 5
+    return config
+
+
+def test_worker_pool_matches_serial_runs(short_config):
+    """Seeds and aggregation order don't depend on max_workers."""
+    serial = run_monte_carlo(short_config, num_runs=3, run_fn=run_simulation)
+    pooled = run_monte_carlo(short_config, num_runs=3, run_fn=run_simulation, max_workers=2)
+
+    assert pooled.bluestar_stats.result() == serial.bluestar_stats.result()
+    assert pooled.daily_bluestar_means == serial.daily_bluestar_means
+    assert pooled.daily_bluestar_stds == serial.daily_bluestar_stds
+    assert pooled.daily_category_level_means == serial.daily_category_level_means
+    assert pooled.daily_hero_level_means == serial.daily_hero_level_means
+
+
+def test_invalid_run_count_rejected(short_config):
+    with pytest.raises(ValueError):
+        run_monte_carlo(short_config, num_runs=0, run_fn=run_simulation)
+    with pytest.raises(ValueError):
+        run_monte_carlo(short_config, num_runs=501, run_fn=run_simulation)
+
+
+def test_single_run_daily_stats_match_snapshots(short_config):
+    """One run: per-day means are that run's values and stds are zero."""
+    mc = run_monte_carlo(short_config, num_runs=1, run_fn=run_simulation)
+    snapshots = run_simulation(short_config, rng=Random(1)).daily_snapshots
+
+    assert mc.daily_bluestar_means == [float(s.total_bluestars) for s in snapshots]
+    assert mc.daily_coin_balance_means == [float(s.coins_balance) for s in snapshots]
+    assert mc.daily_bluestar_stds == [0.0] * short_config.num_days
+    assert all(stds == [0.0] * short_config.num_days
+               for stds in mc.daily_upgrade_count_stds.values())
+
+
+def test_disabling_pull_logs_keeps_results(short_config):
+    """log_pulls=False only drops the pull log; the run itself is unchanged."""
+    logged = run_simulation(short_config, rng=Random(4))
+    short_config.log_pulls = False
+    unlogged = run_simulation(short_config, rng=Random(4))
+
+    assert logged.pull_logs and unlogged.pull_logs == []
+    assert unlogged.daily_snapshots == logged.daily_snapshots
+    assert unlogged.total_bluestars == logged.total_bluestars
@@ -1,5 +1,7 @@
 """Tests for URL configuration encoding/decoding."""
 
+import base64
+import gzip
 import re
 
 import pytest
@@ -37,7 +39,7 @@ def test_empty_string():
 
 
 def test_compression_effectiveness():
-    """Verify gzip compression reduces size significantly."""
+    """Verify compression reduces size significantly."""
     config = load_defaults()
     json_str = config.model_dump_json()
     encoded = encode_config(config)
@@ -45,3 +47,21 @@ def test_compression_effectiveness():
     # Encoded length should be significantly less than raw JSON
     # Typical: ~8300 bytes JSON → ~2000-3000 bytes compressed+encoded
     assert len(encoded) < len(json_str) * 0.5
+
+
+def test_legacy_gzip_url_still_decodes():
+    """Links shared before the xz switch (gzip payloads) keep working."""
+    config = load_defaults()
+    legacy = base64.urlsafe_b64encode(
+        gzip.compress(config.model_dump_json().encode("utf-8"), compresslevel=6)
+    ).decode("ascii")
+    assert decode_config(legacy) == config
+
+
+def test_encoding_shorter_than_gzip():
+    """xz links are shorter than the old gzip level-6 links."""
+    config = load_defaults()
+    legacy_len = len(base64.urlsafe_b64encode(
+        gzip.compress(config.model_dump_json().encode("utf-8"), compresslevel=6)
+    ))
+    assert len(encode_config(config)) < legacy_len
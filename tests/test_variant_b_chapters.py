@@ -128,6 +128,16 @@ def test_chapters_for_bluestars_lookup():
     assert chapters_for_bluestars([], 999, 0) == 0
 
 
+def test_chapters_for_bluestars_bisect_matches_scan():
+    """`ascending=True` bisects; on a sorted table it counts like the scan."""
+    thresholds = load_default_bluestar_thresholds()
+    for bs in [0, 1, *thresholds, *(t + 0.5 for t in thresholds), thresholds[-1] * 3]:
+        for beaten in (0, 5):
+            assert chapters_for_bluestars(thresholds, bs, beaten, ascending=True) == (
+                chapters_for_bluestars(thresholds, bs, beaten)
+            )
+
+
 def test_default_bluestar_thresholds_load():
     table = load_default_bluestar_thresholds()
     assert table, "Default `All` cohort thresholds should be non-empty"
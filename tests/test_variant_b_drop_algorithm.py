@@ -0,0 +1,143 @@
+"""Tests for the Variant B hero-card rarity roll (drop_algorithm.py).
+
+`compute_rarity_probabilities` is checked against the config weights and,
+empirically, against the rarities `select_hero_card` actually rolls.
+"""
+
+from __future__ import annotations
+
+from random import Random
+
+import numpy as np
+import pytest
+
+from simulation.variants.variant_b.config_loader import load_defaults
+from simulation.variants.variant_b.day_simulator import init_state
+from simulation.variants.variant_b.drop_algorithm import (
+    _STREAK_FIELDS,
+    _weighted_choice,
+    compute_rarity_probabilities,
+    get_coins_per_dupe,
+    select_hero_card,
+)
+from simulation.variants.variant_b.models import HeroCardRarity, clear_derived_caches
+
+NUM_ROLLS = 10_000
+RARITIES = [HeroCardRarity.GRAY, HeroCardRarity.BLUE, HeroCardRarity.GOLD]
+
+
+@pytest.fixture
+def config():
+    return load_defaults()
+
+
+@pytest.fixture
+def game_state(config):
+    """Fresh state with every card of the first hero unlocked (all rarities)."""
+    state = init_state(config)
+    hero_state = next(iter(state.heroes.values()))
+    for card in hero_state.cards.values():
+        card.unlocked = True
+    return state
+
+
+@pytest.fixture
+def hero_id(game_state):
+    return next(iter(game_state.heroes))
+
+
+def test_probabilities_follow_config_weights(config, game_state, hero_id):
+    dc = config.drop_config
+    probs = compute_rarity_probabilities(game_state, config, hero_id)
+
+    weights = [dc.rarity_weight_gray, dc.rarity_weight_blue, dc.rarity_weight_gold]
+    assert list(probs) == RARITIES
+    assert sum(probs.values()) == pytest.approx(1.0)
+    for rarity, weight in zip(RARITIES, weights):
+        assert probs[rarity] == pytest.approx(weight / sum(weights))
+
+
+def test_rarity_streak_penalizes_last_rarity(config, game_state, hero_id):
+    dc = config.drop_config
+    game_state.last_rarity_pulled = HeroCardRarity.GOLD.value
+    game_state.rarity_streak_count = 2
+    probs = compute_rarity_probabilities(game_state, config, hero_id)
+
+    gold = dc.rarity_weight_gold * dc.streak_decay_rarity ** 2
+    total = dc.rarity_weight_gray + dc.rarity_weight_blue + gold
+    assert probs[HeroCardRarity.GOLD] == pytest.approx(gold / total)
+    assert probs[HeroCardRarity.GRAY] == pytest.approx(dc.rarity_weight_gray / total)
+
+
+def test_only_unlocked_rarities_can_roll(config, game_state, hero_id):
+    for card in game_state.heroes[hero_id].cards.values():
+        card.unlocked = card.rarity == HeroCardRarity.BLUE
+    assert compute_rarity_probabilities(game_state, config, hero_id) == {
+        HeroCardRarity.BLUE: 1.0,
+    }
+    assert compute_rarity_probabilities(game_state, config, "no_such_hero") == {}
+
+
+def test_weighted_choice_follows_cumulative_rule(config, game_state, hero_id):
+    """`_weighted_choice` picks the first item whose running weight reaches the roll."""
+    probs = compute_rarity_probabilities(game_state, config, hero_id)
+    rarities = list(probs)
+    weights = [probs[r] for r in rarities]
+    rolls = np.random.default_rng(7).random(500)
+    cumulative = np.cumsum(weights)
+    expected = np.minimum(
+        np.searchsorted(cumulative, rolls * cumulative[-1], side="left"), len(rarities) - 1,
+    )
+
+    class _FixedRoll:
+        def __init__(self, value):
+            self.value = value
+
+        def random(self):
+            return self.value
+
+    picks = [rarities.index(_weighted_choice(rarities, weights, _FixedRoll(r))) for r in rolls]
+    assert picks == expected.tolist()
+
+
+@pytest.mark.parametrize("last_rarity, streak", [(None, 0), (HeroCardRarity.GOLD.value, 2)])
+def test_selected_rarities_match_probabilities(config, game_state, hero_id, last_rarity, streak):
+    """Seeded `select_hero_card` picks land on rarities at the computed odds.
+
+    Streak state is restored before every pick so each roll sees the same
+    probabilities; the other day-0 heroes are dropped so the hero is fixed.
+    """
+    game_state.heroes = {hero_id: game_state.heroes[hero_id]}
+    game_state.last_rarity_pulled = last_rarity
+    game_state.rarity_streak_count = streak
+    streak_state = {
+        attr: getattr(game_state, attr)
+        for fields in _STREAK_FIELDS.values() for attr in fields
+    }
+    probs = compute_rarity_probabilities(game_state, config, hero_id)
+    rarity_of = {cid: card.rarity for cid, card in game_state.heroes[hero_id].cards.items()}
+
+    rng = Random(42)
+    counts = dict.fromkeys(probs, 0)
+    for _ in range(NUM_ROLLS):
+        for attr, value in streak_state.items():
+            setattr(game_state, attr, value)
+        picked_hero, card_id = select_hero_card(game_state, config, rng)
+        assert picked_hero == hero_id
+        counts[rarity_of[card_id]] += 1
+
+    for rarity, p in probs.items():
+        assert counts[rarity] / NUM_ROLLS == pytest.approx(p, abs=0.02)
+
+
+def test_memoized_lookups_follow_in_place_edits(config):
+    """Editor-style in-place edits are picked up once derived caches clear."""
+    gold_range = next(
+        dr for dr in config.hero_duplicate_ranges if dr.rarity == HeroCardRarity.GOLD
+    )
+    before = get_coins_per_dupe(1, HeroCardRarity.GOLD, config)
+
+    gold_range.coins_per_dupe = [before + 7] + list(gold_range.coins_per_dupe[1:])
+    clear_derived_caches(config)
+
+    assert get_coins_per_dupe(1, HeroCardRarity.GOLD, config) == before + 7